@@ -35,9 +35,12 @@ class CommandIntent(Enum):
     SCORE = auto()
     INVALID = auto()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedIntent:
-    """Class to hold the parsed command information."""
+    """Class to hold the parsed command information.
+
+    Frozen so the parser can safely hand out shared, precomputed instances.
+    """
     intent: CommandIntent
     action: Optional[str] = None
     target: Optional[str] = None
@@ -1,5 +1,7 @@
 """Constants used by the NLP command parser."""
 
+from typing import Dict, List, Tuple
+
 from ..command_defs import CommandIntent # Adjust import path relative to this new location
 
 # Define verb patterns for each intent
@@ -146,6 +148,49 @@ VERB_PATTERNS = {
     "read": {CommandIntent.GATHER_INFO: 85}
 }
 
+def _build_verb_intent_index() -> Dict[str, Tuple[CommandIntent, ...]]:
+    """Builds a reverse index mapping each verb keyword to the intents that list it.
+
+    Returns:
+        Dict[str, Tuple[CommandIntent, ...]]: Verb -> intents, in VERB_PATTERNS order.
+    """
+    index: Dict[str, List[CommandIntent]] = {}
+    for intent, data in VERB_PATTERNS.items():
+        # Skip the per-verb weight entries (e.g. "use"), which carry no "verbs" list
+        if not isinstance(intent, CommandIntent):
+            continue
+        for verb in data.get("verbs", []):
+            intents = index.setdefault(verb, [])
+            if intent not in intents:
+                intents.append(intent)
+    return {verb: tuple(intents) for verb, intents in index.items()}
+
+# One hash lookup per token form replaces scanning every intent's verb list
+VERB_INTENT_INDEX = _build_verb_intent_index()
+
+# Position of each intent in VERB_PATTERNS, used to keep match order deterministic
+VERB_INTENT_ORDER = {intent: rank for rank, intent in enumerate(VERB_PATTERNS)}
+
+# Zero-argument commands whose parse never depends on the NLP pipeline: command -> (intent, action, direction)
+SHORTCUT_COMMANDS = {
+    "i": (CommandIntent.INVENTORY, None, None),
+    "l": (CommandIntent.LOOK, None, None),
+    "q": (CommandIntent.QUIT, None, None),
+    "n": (CommandIntent.MOVE, None, "north"),
+    "s": (CommandIntent.MOVE, None, "south"),
+    "e": (CommandIntent.MOVE, None, "east"),
+    "w": (CommandIntent.MOVE, None, "west"),
+    "u": (CommandIntent.MOVE, None, "up"),
+    "d": (CommandIntent.MOVE, None, "down"),
+    "inventory": (CommandIntent.INVENTORY, "inventory", None),
+    "inv": (CommandIntent.INVENTORY, "inv", None),
+    "look": (CommandIntent.LOOK, "look", None),
+    "quit": (CommandIntent.QUIT, "quit", None),
+    "exit": (CommandIntent.QUIT, "exit", None),
+    "help": (CommandIntent.HELP, "help", None),
+    "wait": (CommandIntent.TIME, "wait", None),
+}
+
 # Define intent priorities (higher number = higher priority)
 INTENT_PRIORITIES = {
     CommandIntent.COMBAT: 100,
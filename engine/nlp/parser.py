@@ -1,4 +1,5 @@
 # engine/nlp/parser.py
+import dataclasses
 import logging
 from typing import Dict, List, Optional, Tuple, Set, Any
 from dataclasses import dataclass, field
@@ -11,7 +12,7 @@ from ..command_defs import CommandIntent, ParsedIntent
 from ..game_state import GameState # GameState needed for object data access
 
 # Import from the new nlp sub-package
-from .constants import VERB_PATTERNS, INTENT_PRIORITIES, CONTEXT_WORDS
+from .constants import VERB_PATTERNS, VERB_INTENT_INDEX, VERB_INTENT_ORDER, INTENT_PRIORITIES, CONTEXT_WORDS, SHORTCUT_COMMANDS
 from .patterns import generate_patterns
 
 # --- Helper Dataclasses ---
@@ -54,6 +55,7 @@ class NLPCommandParser:
         self.game_state = game_state
         self.nlp = self._load_spacy_model()
         self.valid_words = self._build_valid_words_set()
+        self.shortcut_intents = self._build_shortcut_intents()
         self.add_game_vocabulary() # Placeholder for tokenizer exceptions
         self.custom_patterns = generate_patterns(self.game_state)
         self.initialize_entity_ruler()
@@ -91,6 +93,13 @@ class NLPCommandParser:
         ])
         return valid_words
 
+    def _build_shortcut_intents(self) -> Dict[str, ParsedIntent]:
+        """Precomputes the ParsedIntent for each zero-argument shortcut command."""
+        return {
+            command: ParsedIntent(intent=intent, action=action, direction=direction, original_input=command)
+            for command, (intent, action, direction) in SHORTCUT_COMMANDS.items()
+        }
+
     def add_game_vocabulary(self) -> None:
         """Add game-specific vocabulary exceptions to the NLP pipeline's tokenizer."""
         # Example: if "datapad" should always be one token
@@ -126,9 +135,9 @@ class NLPCommandParser:
         if not command_lower:
             return ParsedIntent(intent=CommandIntent.UNKNOWN, original_input=command_original_case)
 
-        # 1. Handle single letter shortcuts
-        single_letter_result = self._check_single_letter(command_lower, command_original_case)
-        if single_letter_result: return single_letter_result
+        # 1. Handle zero-argument shortcuts (single letters, bare "quit", "look", ...)
+        shortcut_result = self._check_shortcut_command(command_lower, command_original_case)
+        if shortcut_result: return shortcut_result
 
         # 2. Run spaCy NLP pipeline
         nlp_result = self._run_spacy(command_lower)
@@ -186,23 +195,16 @@ class NLPCommandParser:
         logging.debug(f"Preprocessing: Original='{command_original_case}', Lower='{command_lower}'")
         return command_original_case, command_lower
 
-    def _check_single_letter(self, command_lower: str, command_original_case: str) -> Optional[ParsedIntent]:
-        """Check for single-letter shortcut commands."""
-        single_letter_intents = {
-            "i": CommandIntent.INVENTORY, "l": CommandIntent.LOOK, "q": CommandIntent.QUIT,
-            "n": CommandIntent.MOVE, "s": CommandIntent.MOVE, "e": CommandIntent.MOVE, "w": CommandIntent.MOVE,
-            "u": CommandIntent.MOVE, "d": CommandIntent.MOVE,
-            # Add other single letters like 'x' for examine if desired
-        }
-        if command_lower in single_letter_intents:
-            intent = single_letter_intents[command_lower]
-            logging.debug(f"Matched single-letter command '{command_lower}' to intent {intent}")
-            direction = command_lower if intent == CommandIntent.MOVE else None
-            # Normalize single letter directions
-            if direction in ['n','s','e','w','u','d']:
-                 direction = {'n':'north','s':'south','e':'east','w':'west','u':'up','d':'down'}.get(direction)
-            return ParsedIntent(intent=intent, direction=direction, original_input=command_original_case)
-        return None
+    def _check_shortcut_command(self, command_lower: str, command_original_case: str) -> Optional[ParsedIntent]:
+        """Return the precomputed ParsedIntent for a zero-argument shortcut command, if any."""
+        shortcut = self.shortcut_intents.get(command_lower)
+        if shortcut is None:
+            return None
+        logging.debug(f"Matched shortcut command '{command_lower}' to intent {shortcut.intent}")
+        # The shared instance is reused as-is unless the player typed it in a different case
+        if shortcut.original_input == command_original_case:
+            return shortcut
+        return dataclasses.replace(shortcut, original_input=command_original_case)
 
     def _run_spacy(self, command_lower: str) -> NlpProcessingResult:
         """Run the spaCy NLP pipeline and extract key components."""
@@ -252,22 +254,21 @@ class NLPCommandParser:
         matched_verb_intents: Set[CommandIntent] = set()
         first_match_token: Optional[spacy.tokens.Token] = None
 
-        # Score based on verbs matching VERB_PATTERNS
+        # Score based on verbs matching VERB_PATTERNS (one index lookup per token form)
         for token in doc:
             token_check_forms = {token.lemma_, token.text.lower()}
-            for intent, data in VERB_PATTERNS.items():
-                verb_list = data.get("verbs", [])
-                if any(form in verb_list for form in token_check_forms):
-                    # Store the first token that matches any intent keyword
-                    if first_match_token is None:
-                        first_match_token = token
-                        logging.debug(f"First matched keyword token: '{token.text}' at index {token.i}")
-                        
-                    if intent not in matched_verb_intents:
-                        matched_verb_intents.add(intent)
-                        priority = INTENT_PRIORITIES.get(intent, 1)
-                        result.possible_intents[intent] = result.possible_intents.get(intent, 0) + 1.0 * priority
-                        logging.debug(f"Verb/Keyword '{token.text}' added score {priority} for intent {intent}")
+            token_intents = {intent for form in token_check_forms for intent in VERB_INTENT_INDEX.get(form, ())}
+            for intent in sorted(token_intents, key=VERB_INTENT_ORDER.__getitem__):
+                # Store the first token that matches any intent keyword
+                if first_match_token is None:
+                    first_match_token = token
+                    logging.debug(f"First matched keyword token: '{token.text}' at index {token.i}")
+
+                if intent not in matched_verb_intents:
+                    matched_verb_intents.add(intent)
+                    priority = INTENT_PRIORITIES.get(intent, 1)
+                    result.possible_intents[intent] = result.possible_intents.get(intent, 0) + 1.0 * priority
+                    logging.debug(f"Verb/Keyword '{token.text}' added score {priority} for intent {intent}")
 
         result.matched_keyword_token = first_match_token
         logging.debug(f"Intents initially matched by verbs/keywords: {list(result.possible_intents.keys())}")
@@ -8,7 +8,7 @@ from .game_state import GameState, PowerState
 import logging
 
 # Import the constants from the new module
-from .nlp.constants import VERB_PATTERNS, INTENT_PRIORITIES, CONTEXT_WORDS
+from .nlp.constants import VERB_PATTERNS, VERB_INTENT_INDEX, VERB_INTENT_ORDER, INTENT_PRIORITIES, CONTEXT_WORDS
 # Import the pattern generation function
 from .nlp.patterns import generate_patterns
 
@@ -181,11 +181,10 @@ class NLPCommandParser:
             # Handle cases like "inventory" where it might not be tagged as VERB
             # Check both lemma and lowercased text against verbs
             token_check_forms = {token.lemma_, token.text.lower()}
-            for intent, data in VERB_PATTERNS.items():
-                verb_list = data.get("verbs", [])
-                if any(form in verb_list for form in token_check_forms):
-                    matched_verb_intents.add(intent)
-                    possible_intents[intent] = possible_intents.get(intent, 0) + 1.0 * INTENT_PRIORITIES.get(intent, 1)
+            token_intents = {intent for form in token_check_forms for intent in VERB_INTENT_INDEX.get(form, ())}
+            for intent in sorted(token_intents, key=VERB_INTENT_ORDER.__getitem__):
+                matched_verb_intents.add(intent)
+                possible_intents[intent] = possible_intents.get(intent, 0) + 1.0 * INTENT_PRIORITIES.get(intent, 1)
         logging.debug(f"Intents matched by verbs/keywords: {matched_verb_intents}")
 
         # --- Entity Analysis --- 
@@ -1,5 +1,5 @@
 from typing import List, Tuple, Optional, Set, Dict, Union
-from pydantic import BaseModel, Field, field_validator, constr
+from pydantic import BaseModel, ConfigDict, Field, field_validator, constr
 from enum import Enum
 import re
 
@@ -33,8 +33,20 @@ class RoomState(str, Enum):
     MAIN_POWER = "main_power"
     TORCH_LIGHT = "torch_light"
 
+# Built once at import rather than on every exit validation
+VALID_EXIT_DIRECTIONS = frozenset({
+    'north', 'n', 'south', 's', 'east', 'e', 'west', 'w',
+    'northeast', 'ne', 'northwest', 'nw', 'southeast', 'se',
+    'southwest', 'sw', 'up', 'u', 'down', 'd', 'in', 'out'
+})
+
 class RoomDescription(BaseModel):
-    """Model for room descriptions in different states"""
+    """Model for room descriptions in different states.
+
+    Frozen so one validated instance can be shared between rooms.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     offline: constr(min_length=1, max_length=1000) = Field(..., description="Description when room is offline")
     emergency: constr(min_length=1, max_length=1000) = Field(..., description="Description when room is in emergency mode")
     main_power: constr(min_length=1, max_length=1000) = Field(..., description="Description when room has main power")
@@ -49,14 +61,10 @@ class RoomExit(BaseModel):
     @classmethod
     def validate_direction(cls, v: str) -> str:
         """Validate exit direction is one of the standard directions"""
-        valid_directions = {
-            'north', 'n', 'south', 's', 'east', 'e', 'west', 'w',
-            'northeast', 'ne', 'northwest', 'nw', 'southeast', 'se',
-            'southwest', 'sw', 'up', 'u', 'down', 'd', 'in', 'out'
-        }
-        if v.lower() not in valid_directions:
-            raise ValueError(f"Invalid direction: {v}. Must be one of {valid_directions}")
-        return v.lower()
+        direction = v.lower()
+        if direction not in VALID_EXIT_DIRECTIONS:
+            raise ValueError(f"Invalid direction: {v}. Must be one of {sorted(VALID_EXIT_DIRECTIONS)}")
+        return direction
 
 class Room(BaseModel):
     """Main model for room data"""
@@ -104,10 +112,12 @@ class Room(BaseModel):
     @classmethod
     def validate_exits(cls, v: List[RoomExit]) -> List[RoomExit]:
         """Validate room exits"""
-        # Check for duplicate directions
-        directions = [exit.direction for exit in v]
-        if len(directions) != len(set(directions)):
-            raise ValueError("Each room can only have one exit in each direction")
+        # Check for duplicate directions, stopping at the first repeat
+        seen_directions: Set[str] = set()
+        for exit in v:
+            if exit.direction in seen_directions:
+                raise ValueError(f"Each room can only have one exit in each direction (duplicate: {exit.direction})")
+            seen_directions.add(exit.direction)
         return v
 
     @field_validator('name')
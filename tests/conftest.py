@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the Starship Adventure 2 test suite.
+"""
+
+import pytest
+from engine.yaml_loader import YAMLLoader
+
+@pytest.fixture(scope="session")
+def loader():
+    """Create one YAML loader shared by every test in the session."""
+    return YAMLLoader()
+
+@pytest.fixture(scope="session")
+def rooms_yaml(loader):
+    """Parse rooms.yaml once per session."""
+    return loader.load_file("rooms.yaml")
+
+@pytest.fixture(scope="session")
+def objects_yaml(loader):
+    """Parse objects.yaml once per session."""
+    return loader.load_file("objects.yaml")
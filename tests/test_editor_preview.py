@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# The object editor needs its GUI and round-trip YAML libraries; skip where they aren't installed
+pytest.importorskip("FreeSimpleGUI")
+ruamel_yaml = pytest.importorskip("ruamel.yaml")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "object_editor"))
+from editor_gui import _PreviewDumper  # noqa: E402
+
+ROUND_TRIP_OBJECT = """\
+id: data_pad
+name: Data Pad
+weight: 0.5
+count: 2
+is_locked: false
+initial_state: true
+is_fragile: &fragile true
+description: |
+  A battered data pad.
+  The screen flickers.
+summary: >
+  Folded text
+  on two lines.
+synonyms:
+  - pad
+  - tablet
+"""
+
+@pytest.fixture(scope="module")
+def loaded_object():
+    """Load the object the way ObjectDataManager does (ruamel round-trip types)."""
+    loader = ruamel_yaml.YAML()
+    loader.preserve_quotes = True
+    return loader.load(ROUND_TRIP_OBJECT)
+
+def test_preview_dump_matches_loaded_values(loaded_object):
+    """Test that the preview renders ruamel objects with the same values, bools as true/false"""
+    text = yaml.dump(loaded_object, Dumper=_PreviewDumper, sort_keys=False, allow_unicode=True)
+    assert "is_locked: false" in text
+    assert "initial_state: true" in text
+    assert "is_fragile: true" in text  # Anchored, so ruamel loads it as a ScalarBoolean (an int subclass)
+    assert yaml.safe_load(text) == yaml.safe_load(ROUND_TRIP_OBJECT)
+
+def test_preview_dump_keeps_block_string_styles(loaded_object):
+    """Test that literal and folded strings keep their block style in the preview"""
+    text = yaml.dump(loaded_object, Dumper=_PreviewDumper, sort_keys=False, allow_unicode=True)
+    assert "description: |" in text
+    assert "summary: >" in text
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import pytest
@@ -10,6 +11,7 @@ sys.path.insert(0, project_root)
 from engine.nlp_command_parser import NLPCommandParser
 from engine.command_defs import CommandIntent
 from engine.game_state import GameState
+from engine.nlp.constants import VERB_PATTERNS, VERB_INTENT_INDEX
 
 class TestNLPCommandParser:
     @pytest.fixture
@@ -18,8 +20,15 @@ class TestNLPCommandParser:
         game_state = GameState(current_room_id="test_room")
         return NLPCommandParser(game_state)
 
-    def generate_verb_documentation(self):
-        """Generate documentation of all verb categories and their test cases."""
+    def generate_verb_documentation(self, writer=None):
+        """Generate documentation of all verb categories and their test cases.
+
+        Args:
+            writer: Optional text stream that also receives the documentation.
+
+        Returns:
+            str: The generated documentation text.
+        """
         parser = NLPCommandParser(GameState(current_room_id="test_room"))
         
         # Create a dictionary to store all test cases
@@ -115,86 +124,105 @@ class TestNLPCommandParser:
             }
         }
         
-        # Generate the documentation file
-        with open("verb_categories.txt", "w") as f:
-            f.write("Verb Categories Documentation\n")
-            f.write("===========================\n\n")
+        # Generate the documentation into memory
+        buffer = io.StringIO()
+        buffer.write("Verb Categories Documentation\n")
+        buffer.write("===========================\n\n")
+        
+        for category, data in verb_categories.items():
+            buffer.write(f"{category}\n")
+            buffer.write("-" * len(category) + "\n")
+            buffer.write(f"Description: {data['description']}\n\n")
+            
+            if "verbs" in data:
+                buffer.write("Verbs:\n")
+                for verb in data["verbs"]:
+                    result = parser.parse_command(verb)
+                    buffer.write(f"  - {verb}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
+            
+            if "directions" in data:
+                buffer.write("Directions:\n")
+                for direction in data["directions"]:
+                    result = parser.parse_command(direction)
+                    buffer.write(f"  - {direction}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n")
+                    buffer.write(f"    Direction: {result.direction}\n\n")
+            
+            if "locations" in data:
+                buffer.write("Locations:\n")
+                for location in data["locations"]:
+                    result = parser.parse_command(f"go to {location}")
+                    buffer.write(f"  - {location}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
             
-            for category, data in verb_categories.items():
-                f.write(f"{category}\n")
-                f.write("-" * len(category) + "\n")
-                f.write(f"Description: {data['description']}\n\n")
-                
-                if "verbs" in data:
-                    f.write("Verbs:\n")
-                    for verb in data["verbs"]:
-                        result = parser.parse_command(verb)
-                        f.write(f"  - {verb}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                if "directions" in data:
-                    f.write("Directions:\n")
-                    for direction in data["directions"]:
-                        result = parser.parse_command(direction)
-                        f.write(f"  - {direction}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n")
-                        f.write(f"    Direction: {result.direction}\n\n")
-                
-                if "locations" in data:
-                    f.write("Locations:\n")
-                    for location in data["locations"]:
-                        result = parser.parse_command(f"go to {location}")
-                        f.write(f"  - {location}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                if "targets" in data:
-                    f.write("Targets:\n")
-                    for target in data["targets"]:
-                        result = parser.parse_command(f"{data['verbs'][0]} {target}")
-                        f.write(f"  - {target}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                if "objects" in data:
-                    f.write("Objects:\n")
-                    for obj in data["objects"]:
-                        result = parser.parse_command(f"{data['verbs'][0]} {obj}")
-                        f.write(f"  - {obj}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                if "weapons" in data:
-                    f.write("Weapons:\n")
-                    for weapon in data["weapons"]:
-                        result = parser.parse_command(f"attack alien with {weapon}")
-                        f.write(f"  - {weapon}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                if "complex_commands" in data:
-                    f.write("Complex Commands:\n")
-                    for command in data["complex_commands"]:
-                        result = parser.parse_command(command)
-                        f.write(f"  - {command}\n")
-                        f.write(f"    Action: {result.action}\n")
-                        f.write(f"    Target: {result.target}\n")
-                        f.write(f"    Intent: {result.intent}\n\n")
-                
-                f.write("\n")
+            if "targets" in data:
+                buffer.write("Targets:\n")
+                for target in data["targets"]:
+                    result = parser.parse_command(f"{data['verbs'][0]} {target}")
+                    buffer.write(f"  - {target}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
+            
+            if "objects" in data:
+                buffer.write("Objects:\n")
+                for obj in data["objects"]:
+                    result = parser.parse_command(f"{data['verbs'][0]} {obj}")
+                    buffer.write(f"  - {obj}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
+            
+            if "weapons" in data:
+                buffer.write("Weapons:\n")
+                for weapon in data["weapons"]:
+                    result = parser.parse_command(f"attack alien with {weapon}")
+                    buffer.write(f"  - {weapon}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
+            
+            if "complex_commands" in data:
+                buffer.write("Complex Commands:\n")
+                for command in data["complex_commands"]:
+                    result = parser.parse_command(command)
+                    buffer.write(f"  - {command}\n")
+                    buffer.write(f"    Action: {result.action}\n")
+                    buffer.write(f"    Target: {result.target}\n")
+                    buffer.write(f"    Intent: {result.intent}\n\n")
+            
+            buffer.write("\n")
+
+        text = buffer.getvalue()
+        if writer is not None:
+            writer.write(text)
+        # Only touch the filesystem when explicitly asked to refresh the docs file
+        if os.environ.get("EMIT_VERB_DOCS"):
+            with open("verb_categories.txt", "w") as doc_file:
+                doc_file.write(text)
+        return text
 
     def test_generate_documentation(self):
         """Test the documentation generation."""
-        self.generate_verb_documentation()
-        assert os.path.exists("verb_categories.txt"), "Documentation file was not created"
+        text = self.generate_verb_documentation()
+        assert len(text) > 0, "Documentation text was not generated"
+
+    def test_verb_intent_index(self):
+        """Test the verb -> intents index agrees with a scan of VERB_PATTERNS."""
+        for verb, intents in VERB_INTENT_INDEX.items():
+            expected = tuple(
+                intent for intent, data in VERB_PATTERNS.items()
+                if isinstance(intent, CommandIntent) and verb in data.get("verbs", [])
+            )
+            assert intents == expected, f"Verb '{verb}' indexed as {intents}, expected {expected}"
+        assert VERB_INTENT_INDEX["hold"] == (CommandIntent.EQUIP, CommandIntent.TAKE)
 
     def test_single_letter_commands(self, parser):
         """Test single letter commands."""
@@ -1,7 +1,15 @@
 import pytest
 import yaml
+from pathlib import Path
 from engine.schemas import Object, ObjectCategory, ObjectProperties, ObjectInteraction
 
+# Resolved from the project root so the suite can run from any directory
+OBJECTS_YAML = Path(__file__).parent.parent / "data" / "objects.yaml"
+
+# YAML size labels -> numeric sizes; anything else is treated as large
+SIZE_VALUES = {"small": 1.0, "medium": 2.0}
+LARGE_SIZE = 3.0
+
 def test_valid_container():
     """Test creating a valid container object"""
     container_data = {
@@ -123,53 +131,55 @@ def test_empty_name():
             description="Test description"
         )
 
-def test_load_from_yaml():
-    """Test loading objects from YAML file"""
-    with open("data/objects.yaml", 'r') as file:
+def _load_objects_yaml():
+    """Parse data/objects.yaml and return its object records."""
+    with open(OBJECTS_YAML, 'r') as file:
         data = yaml.safe_load(file)
-    
     # Skip the defaults section
-    objects_data = data.get('objects', [])
-    
-    for obj_data in objects_data:
-        # Convert YAML data to our schema format
-        object_data = {
-            "object_id": obj_data['id'],
-            "name": obj_data['name'],
-            "category": ObjectCategory(obj_data.get('type', 'DECORATIVE')),
-            "count": 1,  # Default count
-            "weight": float(obj_data.get('weight', 1.0)),
-            "size": float(1.0 if obj_data.get('size') == 'small' else 
-                         2.0 if obj_data.get('size') == 'medium' else 
-                         3.0),  # Convert size strings to numbers
-            "description": obj_data['description'],
-            "power_state": obj_data.get('power_state'),
-            "is_locked": obj_data.get('is_locked', False),
-            "lock_type": obj_data.get('lock_type'),
-            "lock_code": obj_data.get('lock_code'),
-            "lock_key_id": obj_data.get('lock_key_id'),
-            "storage_contents": obj_data.get('storage_contents', []),
-            "synonyms": obj_data.get('synonyms', []),
-            "properties": {
-                "is_interactive": obj_data.get('is_interactive', True),
-                "is_takeable": obj_data.get('is_portable', False),
-                "is_operational": obj_data.get('is_operational', False),
-                "is_storage": obj_data.get('is_storage', False),
-                "is_hackable": obj_data.get('is_hackable', False),
-                "is_hidden": obj_data.get('is_hidden', False),
-                "is_activatable": obj_data.get('is_activatable', False),
-                "is_networked": obj_data.get('is_networked', False),
-                "requires_power": obj_data.get('requires_power', False),
-                "is_stored": obj_data.get('is_stored', False),
-                "is_transferable": obj_data.get('is_transferable', False)
-            },
-            "interaction": {
-                "primary_actions": obj_data.get('commands', [])
-            }
+    return tuple(data.get('objects', []))
+
+def _to_schema_data(obj_data):
+    """Convert a YAML object record to our schema format."""
+    return {
+        "object_id": obj_data['id'],
+        "name": obj_data['name'],
+        "category": ObjectCategory(obj_data.get('type', 'DECORATIVE')),
+        "count": 1,  # Default count
+        "weight": float(obj_data.get('weight', 1.0)),
+        "size": SIZE_VALUES.get(obj_data.get('size'), LARGE_SIZE),  # Convert size strings to numbers
+        "description": obj_data['description'],
+        "power_state": obj_data.get('power_state'),
+        "is_locked": obj_data.get('is_locked', False),
+        "lock_type": obj_data.get('lock_type'),
+        "lock_code": obj_data.get('lock_code'),
+        "lock_key_id": obj_data.get('lock_key_id'),
+        "storage_contents": obj_data.get('storage_contents', []),
+        "synonyms": obj_data.get('synonyms', []),
+        "properties": {
+            "is_interactive": obj_data.get('is_interactive', True),
+            "is_takeable": obj_data.get('is_portable', False),
+            "is_operational": obj_data.get('is_operational', False),
+            "is_storage": obj_data.get('is_storage', False),
+            "is_hackable": obj_data.get('is_hackable', False),
+            "is_hidden": obj_data.get('is_hidden', False),
+            "is_activatable": obj_data.get('is_activatable', False),
+            "is_networked": obj_data.get('is_networked', False),
+            "requires_power": obj_data.get('requires_power', False),
+            "is_stored": obj_data.get('is_stored', False),
+            "is_transferable": obj_data.get('is_transferable', False)
+        },
+        "interaction": {
+            "primary_actions": obj_data.get('commands', [])
         }
-        
-        # Create object and verify it's valid
-        obj = Object(**object_data)
-        assert obj.object_id == obj_data['id']
-        assert obj.name == obj_data['name']
-        assert obj.description == obj_data['description'] 
\ No newline at end of file
+    }
+
+@pytest.mark.parametrize("obj_data", _load_objects_yaml(), ids=lambda d: d["id"])
+def test_load_from_yaml(obj_data):
+    """Test loading each object from the YAML file (one case per object; runs under pytest -n auto)"""
+    object_data = _to_schema_data(obj_data)
+
+    # Create object and verify it's valid
+    obj = Object(**object_data)
+    assert obj.object_id == obj_data['id']
+    assert obj.name == obj_data['name']
+    assert obj.description == obj_data['description']
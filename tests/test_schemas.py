@@ -1,244 +1,86 @@
+import dataclasses
 import pytest
 from engine.schemas import Room, RoomDescription, RoomExit, LocationMode, DeckLevel
 
-def test_valid_room():
-    """Test that a valid room passes validation"""
-    room_data = {
-        "room_id": "ship_bridge",
-        "name": "Ship Bridge",
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [3, 18],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "The bridge is shrouded in darkness.",
-            "emergency": "Dim emergency lighting casts an eerie glow.",
-            "main_power": "The bridge comes alive with brilliant lighting.",
-            "torch_light": "The beam of your torch sweeps across the bridge."
-        },
-        "short_description": {
-            "offline": "Total darkness.",
-            "emergency": "Dim emergency lighting.",
-            "main_power": "Fully operational.",
-            "torch_light": "Flickering torchlight."
-        },
-        "exits": [
-            {
-                "direction": "up",
-                "destination": "captains_door"
-            }
-        ]
-    }
-    
-    room = Room(**room_data)
-    assert room.room_id == "ship_bridge"
-    assert room.name == "Ship Bridge"
-    assert room.location_mode == LocationMode.MAIN_SHIP
-    assert room.deck_level == DeckLevel.BRIDGE_DECK
+# Enum members used throughout this module, resolved once
+_MAIN_SHIP = LocationMode.MAIN_SHIP
+_BRIDGE_DECK = DeckLevel.BRIDGE_DECK
 
-def test_invalid_grid_coordinates():
-    """Test that negative grid coordinates are rejected"""
-    room_data = {
-        "room_id": "test_room",
-        "name": "Test Room",
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [-1, 0],  # Invalid negative coordinate
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        }
-    }
-    
-    with pytest.raises(ValueError):
-        Room(**room_data)
+# Pre-validated descriptions; Room accepts these instances without re-validating them (Pydantic v2 default)
+_FIRST_VISIT_DESC = RoomDescription.model_validate({
+    "offline": "The bridge is shrouded in darkness.",
+    "emergency": "Dim emergency lighting casts an eerie glow.",
+    "main_power": "The bridge comes alive with brilliant lighting.",
+    "torch_light": "The beam of your torch sweeps across the bridge."
+})
+_SHORT_DESC = RoomDescription.model_validate({
+    "offline": "Total darkness.",
+    "emergency": "Dim emergency lighting.",
+    "main_power": "Fully operational.",
+    "torch_light": "Flickering torchlight."
+})
 
-def test_invalid_room_count():
-    """Test that non-positive room count is rejected"""
-    room_data = {
-        "room_id": "test_room",
-        "name": "Test Room",
-        "room_count": 0,  # Invalid room count
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [0, 0],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
+# A known-good room payload; negative tests override a single field of it
+BASE_ROOM = {
+    "room_id": "ship_bridge",
+    "name": "Ship Bridge",
+    "room_count": 1,
+    "location_mode": _MAIN_SHIP,
+    "deck_level": _BRIDGE_DECK,
+    "grid_reference": [3, 18],
+    "grid_size": [5, 4],
+    "windows_present": False,
+    "backup_power": True,
+    "emergency_exit": False,
+    "requires_light_source": False,
+    "first_visit_description": _FIRST_VISIT_DESC,
+    "short_description": _SHORT_DESC,
+    "exits": [
+        {
+            "direction": "up",
+            "destination": "captains_door"
         }
-    }
-    
-    with pytest.raises(ValueError):
-        Room(**room_data)
+    ]
+}
 
-def test_invalid_room_id():
-    """Test that invalid room IDs are rejected"""
-    room_data = {
-        "room_id": "Ship Bridge",  # Invalid: contains spaces and uppercase
-        "name": "Test Room",
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [0, 0],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        }
-    }
-    
-    with pytest.raises(ValueError):
-        Room(**room_data)
+@dataclasses.dataclass(frozen=True, slots=True)
+class _ExpectedRoom:
+    """Identity fields the valid room must come back with."""
+    room_id: str
+    name: str
+    location_mode: LocationMode
+    deck_level: DeckLevel
 
-def test_invalid_exit_direction():
-    """Test that invalid exit directions are rejected"""
-    room_data = {
-        "room_id": "test_room",
-        "name": "Test Room",
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [0, 0],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "exits": [
-            {
-                "direction": "invalid_direction",  # Invalid direction
-                "destination": "test_destination"
-            }
-        ]
-    }
-    
-    with pytest.raises(ValueError):
-        Room(**room_data)
+_EXPECTED = _ExpectedRoom("ship_bridge", "Ship Bridge", _MAIN_SHIP, _BRIDGE_DECK)
+
+@pytest.fixture(scope="module")
+def valid_room():
+    """Build the valid room once for every test in this module."""
+    return Room.model_validate(BASE_ROOM)
+
+def test_valid_room(valid_room):
+    """Test that a valid room passes validation"""
+    actual = (valid_room.room_id, valid_room.name, valid_room.location_mode, valid_room.deck_level)
+    assert actual == dataclasses.astuple(_EXPECTED)
 
-def test_duplicate_exit_directions():
-    """Test that duplicate exit directions are rejected"""
-    room_data = {
-        "room_id": "test_room",
-        "name": "Test Room",
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [0, 0],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "exits": [
-            {
-                "direction": "north",
-                "destination": "room1"
-            },
-            {
-                "direction": "north",  # Duplicate direction
-                "destination": "room2"
-            }
-        ]
-    }
-    
+def test_room_description_is_frozen():
+    """Test that shared room descriptions cannot be mutated or given extra states"""
+    with pytest.raises(ValueError):
+        _SHORT_DESC.offline = "Changed."
     with pytest.raises(ValueError):
-        Room(**room_data)
+        RoomDescription(offline="Dark.", emergency="Dim.", main_power="Bright.",
+                        torch_light="Flickering.", strobe="Flashing.")
 
-def test_empty_room_name():
-    """Test that empty room names are rejected"""
-    room_data = {
-        "room_id": "test_room",
-        "name": "   ",  # Empty name with only whitespace
-        "room_count": 1,
-        "location_mode": LocationMode.MAIN_SHIP,
-        "deck_level": DeckLevel.BRIDGE_DECK,
-        "grid_reference": [0, 0],
-        "grid_size": [5, 4],
-        "windows_present": False,
-        "backup_power": True,
-        "emergency_exit": False,
-        "requires_light_source": False,
-        "first_visit_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        },
-        "short_description": {
-            "offline": "Dark.",
-            "emergency": "Dim.",
-            "main_power": "Bright.",
-            "torch_light": "Flickering."
-        }
-    }
-    
+@pytest.mark.parametrize("override", [
+    {"grid_reference": [-1, 0]},  # Invalid negative coordinate
+    {"room_count": 0},  # Invalid room count
+    {"room_id": "Ship Bridge"},  # Invalid: contains spaces and uppercase
+    {"exits": [{"direction": "invalid_direction", "destination": "test_destination"}]},
+    {"exits": [{"direction": "north", "destination": "room1"},
+               {"direction": "north", "destination": "room2"}]},  # Duplicate direction
+    {"name": "   "},  # Empty name with only whitespace
+], ids=["neg_grid", "zero_count", "bad_id", "bad_dir", "dup_dir", "empty_name"])
+def test_invalid_room(override):
+    """Test that a room with a single invalid field is rejected"""
     with pytest.raises(ValueError):
-        Room(**room_data) 
\ No newline at end of file
+        Room.model_validate(BASE_ROOM | override)
@@ -2,20 +2,25 @@
 Test module for the YAML loader.
 """
 
+import io
 import pytest
 from pathlib import Path
+import yaml
+from pydantic import ValidationError
+from engine import yaml_loader
 from engine.yaml_loader import YAMLLoader
 
-def test_yaml_loader_initialization():
+def test_yaml_loader_initialization(loader):
     """Test YAML loader initialization."""
-    loader = YAMLLoader()
     assert loader.data_dir == Path("data")
     assert loader.data_dir.exists()
+    # Surface a silent fallback to the pure-Python parser when libyaml is available
+    if yaml.__with_libyaml__:
+        assert yaml_loader.SafeLoader is yaml.CSafeLoader
 
-def test_load_rooms():
+def test_load_rooms(loader, rooms_yaml):
     """Test loading room data."""
-    loader = YAMLLoader()
-    data = loader.load_file("rooms.yaml")
+    data = rooms_yaml
     
     # Check basic structure
     assert "rooms" in data
@@ -32,10 +37,9 @@ def test_load_rooms():
     # Validate room data
     assert loader.validate_room_data(bridge)
 
-def test_load_objects():
+def test_load_objects(loader, objects_yaml):
     """Test loading object data."""
-    loader = YAMLLoader()
-    data = loader.load_file("objects.yaml")
+    data = objects_yaml
     
     # Check basic structure
     assert "objects" in data
@@ -51,36 +55,73 @@ def test_load_objects():
     # Validate object data
     assert loader.validate_object_data(chair)
 
-def test_invalid_file():
+def test_invalid_file(loader, tmp_path):
     """Test handling of invalid files."""
-    loader = YAMLLoader()
-    
     # Test non-existent file
     with pytest.raises(FileNotFoundError):
         loader.load_file("nonexistent.yaml")
     
     # Test invalid YAML
-    invalid_yaml = Path("data/invalid.yaml")
-    invalid_yaml.write_text("invalid: yaml: content: -")
-    
-    with pytest.raises(Exception):
-        loader.load_file("invalid.yaml")
+    with pytest.raises(yaml.YAMLError):
+        loader.load_stream(io.StringIO("invalid: yaml: content: -"))
     
-    invalid_yaml.unlink()  # Clean up test file 
+    # Test invalid YAML file, written to a per-test directory rather than data/
+    (tmp_path / "invalid.yaml").write_text("invalid: yaml: content: -")
+    with pytest.raises(yaml.YAMLError):
+        YAMLLoader(str(tmp_path)).load_file("invalid.yaml")
+
+NESTED_YAML = """
+rooms:
+  - id: nested_room
+    name: Nested Room
+    description: A room with nested objects
+    exits:
+      north:
+        room_id: corridor
+        requires_key: true
+        key_id: master_key
+    objects:
+      - id: nested_obj
+        name: Nested Object
+        description: An object with nested properties
+        properties:
+          power_level: 100
+          status: active
+    accessible: true
+"""
 
-def test_room_validation_failures():
-    """Test room validation with invalid data."""
-    loader = YAMLLoader()
+def test_nested_structures(loader):
+    """Test loading and validation of nested room/object structures."""
+    data = loader.load_stream(io.StringIO(NESTED_YAML))
+    room = data["rooms"][0]
     
-    # Missing required fields
-    invalid_room = {
-        "name": "Invalid Room"  # Missing room_id and other required fields
-    }
-    with pytest.raises(ValueError, match="Missing required field"):
-        loader.validate_room_data(invalid_room)
+    # Verify nested structures
+    assert "exits" in room
+    assert "north" in room["exits"]
+    assert room["exits"]["north"]["room_id"] == "corridor"
+    assert room["exits"]["north"]["requires_key"]
+    assert room["exits"]["north"]["key_id"] == "master_key"
     
+    assert "objects" in room
+    assert len(room["objects"]) > 0
+    assert "properties" in room["objects"][0]
+    assert room["objects"][0]["properties"]["power_level"] == 100
+    assert room["objects"][0]["properties"]["status"] == "active"
+
+# Minimal valid description for every power state, shared by the room cases below
+_MIN_DESC = {
+    "offline": "Room is offline",
+    "emergency": "Room is in emergency power",
+    "main_power": "Room has main power",
+    "torch_light": "Room in torch light"
+}
+
+# (payload, location of the first error, pydantic error type, validator kind) for each invalid-data case
+VALIDATION_FAILURE_CASES = [
+    # Missing required fields
+    ({"name": "Invalid Room"}, ("room_id",), "missing", "room"),
     # Invalid exit format
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
         "first_visit_description": {
@@ -91,23 +132,11 @@ def test_room_validation_failures():
         },
         "exits": "not_a_list",  # Should be a list
         "areas": []
-    }
-    with pytest.raises(ValueError, match="Exits must be a list"):
-        loader.validate_room_data(invalid_room)
-
-def test_object_validation_failures():
-    """Test object validation with invalid data."""
-    loader = YAMLLoader()
-    
+    }, ("exits",), "list_type", "room"),
     # Missing required fields
-    invalid_object = {
-        "name": "Invalid Object"  # Missing id and other required fields
-    }
-    with pytest.raises(ValueError, match="Missing required field"):
-        loader.validate_object_data(invalid_object)
-    
+    ({"name": "Invalid Object"}, ("id",), "missing", "object"),
     # Invalid type values
-    invalid_object = {
+    ({
         "id": "test_obj",
         "name": "Test Object",
         "description": "A test object",
@@ -116,72 +145,17 @@ def test_object_validation_failures():
         "is_interactive": True,
         "weight": "not_a_number",  # Should be number
         "size": "medium"
-    }
-    with pytest.raises(ValueError):
-        loader.validate_object_data(invalid_object)
-
-def test_nested_structures():
-    """Test loading and validation of nested room/object structures."""
-    loader = YAMLLoader()
-    
-    # Create a test YAML file with nested structures
-    test_yaml = Path("data/test_nested.yaml")
-    test_yaml.write_text("""
-rooms:
-  - id: nested_room
-    name: Nested Room
-    description: A room with nested objects
-    exits:
-      north:
-        room_id: corridor
-        requires_key: true
-        key_id: master_key
-    objects:
-      - id: nested_obj
-        name: Nested Object
-        description: An object with nested properties
-        properties:
-          power_level: 100
-          status: active
-    accessible: true
-""")
-    
-    try:
-        data = loader.load_file("test_nested.yaml")
-        room = data["rooms"][0]
-        
-        # Verify nested structures
-        assert "exits" in room
-        assert "north" in room["exits"]
-        assert room["exits"]["north"]["room_id"] == "corridor"
-        assert room["exits"]["north"]["requires_key"]
-        assert room["exits"]["north"]["key_id"] == "master_key"
-        
-        assert "objects" in room
-        assert len(room["objects"]) > 0
-        assert "properties" in room["objects"][0]
-        assert room["objects"][0]["properties"]["power_level"] == 100
-        assert room["objects"][0]["properties"]["status"] == "active"
-    finally:
-        test_yaml.unlink()  # Clean up test file
-
-def test_data_type_validation():
-    """Test validation of data types in room and object fields."""
-    loader = YAMLLoader()
-    
-    # Test room with invalid data types
-    invalid_room = {
+    }, ("type",), "literal_error", "object"),
+    # Room with invalid data types
+    ({
         "room_id": 123,  # Should be string
         "name": ["Not", "A", "String"],  # Should be string
         "first_visit_description": "not_a_dict",  # Should be a dictionary
         "exits": {},  # Should be a list
         "areas": "not_a_list"  # Should be list
-    }
-    with pytest.raises(ValueError, match="Room id must be a string"):
-        loader.validate_room_data(invalid_room)
-    
-    # Test object with invalid data types
-    invalid_object = {
+    }, ("room_id",), "string_type", "room"),
+    # Object with invalid data types
+    ({
         "id": "valid_id",
         "name": "Valid Name",
         "description": 42,  # Should be string
@@ -190,16 +164,9 @@ def test_data_type_validation():
         "is_interactive": "not_a_boolean",  # Should be boolean
         "weight": "not_a_number",  # Should be number
         "size": 42  # Should be string
-    }
-    with pytest.raises(ValueError, match="Object description must be a string"):
-        loader.validate_object_data(invalid_object)
-
-def test_power_state_validation():
-    """Test validation of power states in room descriptions."""
-    loader = YAMLLoader()
-    
+    }, ("description",), "string_type", "object"),
     # Missing power states
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
         "first_visit_description": {
@@ -209,12 +176,9 @@ def test_power_state_validation():
         },
         "exits": [],
         "areas": []
-    }
-    with pytest.raises(ValueError, match="Missing required power state"):
-        loader.validate_room_data(invalid_room)
-    
+    }, ("first_visit_description", "main_power"), "missing", "room"),
     # Invalid power state
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
         "first_visit_description": {
@@ -226,24 +190,12 @@ def test_power_state_validation():
         },
         "exits": [],
         "areas": []
-    }
-    with pytest.raises(ValueError, match="Invalid power state"):
-        loader.validate_room_data(invalid_room)
-
-def test_area_validation():
-    """Test validation of areas within rooms."""
-    loader = YAMLLoader()
-    
+    }, ("first_visit_description", "invalid_state"), "extra_forbidden", "room"),
     # Invalid area structure
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
-        "first_visit_description": {
-            "offline": "Room is offline",
-            "emergency": "Room is in emergency power",
-            "main_power": "Room has main power",
-            "torch_light": "Room in torch light"
-        },
+        "first_visit_description": _MIN_DESC,
         "exits": [],
         "areas": [
             {
@@ -251,20 +203,12 @@ def test_area_validation():
                 "name": "Test Area"
             }
         ]
-    }
-    with pytest.raises(ValueError, match="Missing required field 'area_id' in area data"):
-        loader.validate_room_data(invalid_room)
-    
+    }, ("areas", 0, "area_id"), "missing", "room"),
     # Invalid area command aliases
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
-        "first_visit_description": {
-            "offline": "Room is offline",
-            "emergency": "Room is in emergency power",
-            "main_power": "Room has main power",
-            "torch_light": "Room in torch light"
-        },
+        "first_visit_description": _MIN_DESC,
         "exits": [],
         "areas": [
             {
@@ -280,24 +224,12 @@ def test_area_validation():
                 }
             }
         ]
-    }
-    with pytest.raises(ValueError, match="Area command aliases must be a list"):
-        loader.validate_room_data(invalid_room)
-
-def test_exit_validation():
-    """Test validation of room exits."""
-    loader = YAMLLoader()
-    
+    }, ("areas", 0, "command_aliases"), "list_type", "room"),
     # Invalid exit structure
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
-        "first_visit_description": {
-            "offline": "Room is offline",
-            "emergency": "Room is in emergency power",
-            "main_power": "Room has main power",
-            "torch_light": "Room in torch light"
-        },
+        "first_visit_description": _MIN_DESC,
         "exits": [
             {
                 # Missing required exit fields
@@ -305,20 +237,12 @@ def test_exit_validation():
             }
         ],
         "areas": []
-    }
-    with pytest.raises(ValueError, match="Missing required field 'destination' in exit data"):
-        loader.validate_room_data(invalid_room)
-    
+    }, ("exits", 0, "destination"), "missing", "room"),
     # Invalid dynamic description
-    invalid_room = {
+    ({
         "room_id": "test_room",
         "name": "Test Room",
-        "first_visit_description": {
-            "offline": "Room is offline",
-            "emergency": "Room is in emergency power",
-            "main_power": "Room has main power",
-            "torch_light": "Room in torch light"
-        },
+        "first_visit_description": _MIN_DESC,
         "exits": [
             {
                 "direction": "north",
@@ -327,6 +251,22 @@ def test_exit_validation():
             }
         ],
         "areas": []
-    }
-    with pytest.raises(ValueError, match="Exit dynamic description must be a dictionary"):
-        loader.validate_room_data(invalid_room) 
\ No newline at end of file
+    }, ("exits", 0, "dynamic_description"), "dict_type", "room"),
+]
+
+@pytest.mark.parametrize("payload, error_loc, error_type, validator", VALIDATION_FAILURE_CASES, ids=[
+    "room_missing_fields", "room_exits_not_list",
+    "object_missing_fields", "object_invalid_type",
+    "room_bad_types", "object_bad_types",
+    "room_missing_power_state", "room_extra_power_state",
+    "area_missing_fields", "area_aliases_not_list",
+    "exit_missing_fields", "exit_description_not_dict",
+])
+def test_validation_failure(loader, payload, error_loc, error_type, validator):
+    """Test that room and object validation reject each kind of invalid data."""
+    validate = loader.validate_room_data if validator == "room" else loader.validate_object_data
+    with pytest.raises(ValidationError) as exc_info:
+        validate(payload)
+    first_error = exc_info.value.errors()[0]
+    assert first_error["loc"] == error_loc
+    assert first_error["type"] == error_type
@@ -1,9 +1,18 @@
 # GUI for creating, editing, and deleting game objects. 
+#
+# Perf note: this module is GUI-bound (Tk event dispatch and YAML dumping), not numeric,
+# so JIT compilers such as Numba/Cython don't help here. Speed it up by batching widget
+# updates, memoizing manager/YAML output, and driving fields from the _BOOL_PROPS/_NUM_PROPS tables.
 
 import FreeSimpleGUI as sg
 import logging
+import yaml
 import sys # Add sys import
 import os  # Add os import
+from contextlib import contextmanager
+from bisect import insort
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
 
 # --- Add project root to Python path ---
@@ -17,8 +26,32 @@ if str(project_root) not in sys.path:
 # Now imports from engine should work
 from object_data_manager import ObjectDataManager # Import our data manager
 from engine.schemas import ObjectCategory, WearArea # IMPORT WEARAREA
+from ruamel.yaml.scalarbool import ScalarBoolean
+from ruamel.yaml.scalarstring import FoldedScalarString, LiteralScalarString
 from typing import Optional
 
+# The preview pane doesn't need ruamel's round-trip formatting, so it uses
+# PyYAML's C emitter when available (same fallback as engine/yaml_loader.py)
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+class _PreviewDumper(_SafeDumper):
+    """Safe dumper that also accepts ruamel's CommentedMap/CommentedSeq and scalar subclasses."""
+
+for _base_type in (dict, list, int, float):
+    _PreviewDumper.add_multi_representer(_base_type, _SafeDumper.yaml_representers[_base_type])
+# The C emitter only accepts exact str scalar values (not e.g. quoted-string subclasses)
+_PreviewDumper.add_multi_representer(str, lambda dumper, data: dumper.represent_str(str(data)))
+# Keep ruamel's bools and block-style strings looking as they do in the saved file.
+# ScalarBoolean subclasses int, so without this it would render as 0/1.
+_PreviewDumper.add_multi_representer(ScalarBoolean, lambda dumper, data: dumper.represent_bool(bool(data)))
+for _string_type, _style in ((LiteralScalarString, '|'), (FoldedScalarString, '>')):
+    _PreviewDumper.add_multi_representer(
+        _string_type,
+        lambda dumper, data, style=_style: dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style=style))
+
 # Basic logging setup
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -122,14 +155,102 @@ KEY_WEAR_LAYER = "-WEAR_LAYER-"
 KEY_PROP_IS_SURFACE = '-PROP_IS_SURFACE-'
 KEY_PROP_IS_CHARGER = '-PROP_IS_CHARGER-'
 
+# --- Property Field Tables ---
+# (yaml field, element key, default, checkbox label, Properties column) for every
+# boolean property. Column None means the checkbox is placed by hand in the layout.
+_BOOL_PROPS: tuple[tuple[str, str, bool, str, Optional[int]], ...] = (
+    ('is_takeable', KEY_PROP_IS_TAKEABLE, False, "Takeable", 0),
+    ('is_interactive', KEY_PROP_IS_INTERACTIVE, True, "Interactive", 0),
+    ('is_dangerous', KEY_PROP_IS_DANGEROUS, False, "Dangerous", 0),
+    ('is_destroyable', KEY_PROP_IS_DESTROYABLE, False, "Destroyable", 0),
+    ('is_storage', KEY_PROP_IS_STORAGE, False, "Is Storage", 0),
+    ('is_operational', KEY_PROP_IS_OPERATIONAL, False, "Operational", 0),
+    ('is_edible', KEY_PROP_IS_EDIBLE, False, "Edible", 0),
+    ('is_weapon', KEY_PROP_IS_WEAPON, False, "Is Weapon", 0),
+    ('is_movable', KEY_PROP_IS_MOVABLE, False, "Movable", 0),
+    ('is_wearable', KEY_PROP_IS_WEARABLE, False, "Wearable", 0),
+    ('is_flammable', KEY_PROP_IS_FLAMMABLE, False, "Flammable", 1),
+    ('is_toxic', KEY_PROP_IS_TOXIC, False, "Toxic", 1),
+    ('is_food', KEY_PROP_IS_FOOD, False, "Is Food", 1),
+    ('is_cookable', KEY_PROP_IS_COOKABLE, False, "Cookable", 1),
+    ('is_consumable', KEY_PROP_IS_CONSUMABLE, False, "Consumable", 1),
+    ('has_durability', KEY_PROP_HAS_DURABILITY, False, "Has Durability", 1),
+    ('is_hackable', KEY_PROP_IS_HACKABLE, False, "Hackable", 1),
+    ('is_hidden', KEY_PROP_IS_HIDDEN, False, "Hidden", 1),
+    ('is_rechargeable', KEY_PROP_IS_RECHARGEABLE, False, "Rechargeable", 1),
+    ('is_fuel_source', KEY_PROP_IS_FUEL_SOURCE, False, "Fuel Source", 1),
+    ('regenerates', KEY_PROP_REGENERATES, False, "Regenerates", 2),
+    ('is_modular', KEY_PROP_IS_MODULAR, False, "Modular", 2),
+    ('is_stored', KEY_PROP_IS_STORED, False, "Is Stored", 2),
+    ('is_transferable', KEY_PROP_IS_TRANSFERABLE, False, "Transferable", 2),
+    ('is_activatable', KEY_PROP_IS_ACTIVATABLE, False, "Activatable", 2),
+    ('is_networked', KEY_PROP_IS_NETWORKED, False, "Networked", 2),
+    ('requires_power', KEY_PROP_REQUIRES_POWER, False, "Requires Power", 2),
+    ('requires_item', KEY_PROP_REQUIRES_ITEM, False, "Requires Item", 2),
+    ('has_security', KEY_PROP_HAS_SECURITY, False, "Has Security", 2),
+    ('is_sensitive', KEY_PROP_IS_SENSITIVE, False, "Sensitive", 2),
+    ('is_fragile', KEY_PROP_IS_FRAGILE, False, "Fragile", 3),
+    ('is_secret', KEY_PROP_IS_SECRET, False, "Secret", 3),
+    ('can_store_liquids', KEY_PROP_CAN_STORE_LIQUIDS, False, "Stores Liquids", None),
+    ('is_surface', KEY_PROP_IS_SURFACE, False, "Is Surface", 3),
+    ('is_charger', KEY_PROP_IS_CHARGER, False, "Is Charger", 3),
+)
+# (yaml field, element key, label) for the whole-number property inputs
+_NUM_PROPS: tuple[tuple[str, str, str], ...] = (
+    ('storage_capacity', KEY_PROP_STORAGE_CAPACITY, "Storage Capacity"),
+    ('damage', KEY_PROP_DAMAGE, "Damage"),
+    ('durability', KEY_PROP_DURABILITY, "Durability"),
+    ('range', KEY_PROP_RANGE, "Range"),
+)
+
+# Optional top-level text fields: (field, key). Blank in the form, None in the data.
+_OPTIONAL_TEXT_FIELDS: tuple[tuple[str, str], ...] = (
+    ('power_state', KEY_OBJECT_POWER_STATE),
+    ('lock_type', KEY_OBJECT_LOCK_TYPE),
+    ('lock_code', KEY_OBJECT_LOCK_CODE),
+    ('lock_key_id', KEY_OBJECT_LOCK_KEY_ID),
+)
+
+# Every element the editor reads or writes after creation (buttons excluded)
+_ALL_EDITOR_KEYS: tuple[str, ...] = (
+    KEY_OBJECT_DROPDOWN, KEY_TOTAL_OBJECT_COUNT,
+    KEY_OBJECT_ID, KEY_OBJECT_NAME, KEY_OBJECT_IS_PLURAL, KEY_OBJECT_CATEGORY,
+    KEY_OBJECT_LOCATION, KEY_OBJECT_AREA_LOCATION, KEY_OBJECT_COUNT, KEY_OBJECT_WEIGHT,
+    KEY_OBJECT_SIZE, KEY_OBJECT_DESCRIPTION, KEY_OBJECT_SYNONYMS,
+    KEY_OBJECT_INITIAL_STATE, KEY_OBJECT_IS_LOCKED,
+    *(key for _, key in _OPTIONAL_TEXT_FIELDS),
+    *(key for _, key, *_ in _BOOL_PROPS),
+    *(key for _, key, _ in _NUM_PROPS),
+    KEY_WEAR_AREA, KEY_WEAR_LAYER,
+    KEY_INTERACTION_REQUIRED_STATE, KEY_INTERACTION_REQUIRED_ITEMS, KEY_INTERACTION_PRIMARY_ACTIONS,
+    KEY_INTERACTION_EFFECTS, KEY_INTERACTION_SUCCESS, KEY_INTERACTION_FAILURE,
+    KEY_OBJECT_STORAGE_CONTENTS, KEY_OBJECT_STATE_DESCRIPTIONS, KEY_OBJECT_DIGITAL_CONTENT,
+    KEY_YAML_PREVIEW, KEY_VALIDATE_INDICATOR, KEY_STATUS_BAR,
+)
+
+# --- Enum Dropdown Values (built once at import) ---
+_OBJECT_CATEGORY_VALUES = tuple(category.value for category in ObjectCategory)
+_WEAR_AREA_VALUES = tuple(area.value for area in WearArea)
+# Wearability combo choices, each with a leading blank for "none"
+_WEAR_AREA_CHOICES = ('',) + _WEAR_AREA_VALUES
+_WEAR_LAYER_CHOICES = ('', '1', '2', '3', '4', '5')
+# State & Lock combo choices (match the validators on engine.schemas.Object)
+_POWER_STATE_CHOICES = ('', 'offline', 'emergency', 'main_power', 'torch_light')
+_LOCK_TYPE_CHOICES = ('', 'key', 'code', 'biometric')
+
 # --- Helper Functions ---
-def get_object_categories() -> list[str]:
-    """Returns a list of ObjectCategory enum values."""
-    return [category.value for category in ObjectCategory]
+def get_object_categories() -> tuple[str, ...]:
+    """Returns the ObjectCategory enum values."""
+    return _OBJECT_CATEGORY_VALUES
+
+def _parse_list_to_csv(data_list: Optional[list]) -> str:
+    """Converts a list (or None) to a comma-separated string."""
+    return ", ".join(map(str, data_list)) if data_list else ""
 
-def _parse_list_to_csv(data_list: list) -> str:
-    """Converts a list to a comma-separated string."""
-    return ", ".join(str(item) for item in data_list) if data_list else ""
+def _num_str(data: dict, key: str) -> str:
+    """Returns data[key] as a string for an input field, or '' when it is missing or None."""
+    value = data.get(key)
+    return '' if value is None else str(value)
 
 def _parse_dict_to_multiline(data_dict: dict) -> str:
     """Converts a dict to key:value lines."""
@@ -137,47 +258,23 @@ def _parse_dict_to_multiline(data_dict: dict) -> str:
 
 # --- NEW HELPER FUNCTIONS for Digital Content ---
 def _parse_multiline_to_digital_content(multiline_string: str) -> dict:
-    """Converts structured multiline text to a digital content dictionary."""
+    """Converts '---'-separated "key: content" blocks to a digital content dictionary."""
     content_dict = {}
     if not multiline_string or not isinstance(multiline_string, str):
         return content_dict
-    
-    current_file_key = None
-    current_content_lines = []
-    
-    lines = multiline_string.splitlines()
-    
-    for i, line in enumerate(lines):
-        # Check for separator or end of input
-        is_separator = (line.strip() == '---')
-        is_last_line = (i == len(lines) - 1)
-
-        if is_separator or is_last_line:
-            if current_file_key:
-                # Add content for the previous file
-                if is_last_line and not is_separator:
-                     current_content_lines.append(line) # Include last line if not separator
-                content_dict[current_file_key] = '\n'.join(current_content_lines).strip()
-                current_file_key = None
-                current_content_lines = []
-            continue # Skip the separator line itself
-
-        # Check for new file key (key: value format on the first line of a block)
-        if current_file_key is None and ':' in line:
-            key, first_line_content = line.split(':', 1)
-            current_file_key = key.strip()
-            if current_file_key: # Ensure key is not empty
-                 current_content_lines.append(first_line_content.strip()) 
-            else: # Malformed line, treat as content for potential previous block?
-                 current_content_lines.append(line)
-                 current_file_key = None # Reset key
-        elif current_file_key is not None:
-            # Append content line to the current file
-            current_content_lines.append(line)
-        else:
-             # Line before any key is defined, ignore? Or log warning?
-             logging.warning(f"Ignoring line outside of file block: {line}")
-             pass 
+
+    block = []
+    for line in (*multiline_string.splitlines(), '---'): # Trailing separator closes the last block
+        if line.strip() != '---':
+            block.append(line)
+            continue
+        # The block's first "key: ..." line names the file; lines above it are ignored
+        for start, first_line in enumerate(block):
+            key, sep, first_content = first_line.partition(':')
+            if sep and (key := key.strip()):
+                content_dict[key] = '\n'.join([first_content.strip(), *block[start + 1:]]).strip()
+                break
+        block = []
 
     return content_dict
 
@@ -197,70 +294,151 @@ def _parse_digital_content_to_multiline(data_dict: Optional[dict]) -> str:
     return "\n".join(output_lines)
 # --- END NEW HELPER FUNCTIONS ---
 
+# --- Element Cache ---
+# Editor elements resolved once after the window is finalized, so field
+# updates index a plain dict instead of going through window[...] every time.
+_elem_cache: dict = {}
+
+def _elements(window: sg.Window) -> dict:
+    """Returns the cached editor elements, resolving them from the window on first use."""
+    if not _elem_cache:
+        _elem_cache.update({key: window[key] for key in _ALL_EDITOR_KEYS})
+        logging.debug("Cached %s window elements.", len(_elem_cache))
+    return _elem_cache
+
+def _set_field(element, value):
+    """Sets an element's value, skipping the write if the widget already shows it.
+
+    Input/Checkbox values go straight to their tk variable, skipping the
+    per-call bookkeeping in element.update(). Comparing against the live
+    widget (rather than a remembered value) keeps user edits from being
+    mistaken for "unchanged". Elements without get() (e.g. StatusBar) are
+    always updated. Like update(), None leaves the element as is.
+    """
+    if value is None:
+        return
+    if isinstance(element, sg.Checkbox):
+        state = 1 if value else 0
+        if element.TKIntVar.get() != state:
+            element.TKIntVar.set(state)
+    elif isinstance(element, sg.Input):
+        if element.TKStringVar.get() != value:
+            element.TKStringVar.set(value)
+    else:
+        get = getattr(element, 'get', None)
+        if get is None or get() != value:
+            element.update(value)
+
+# Nesting depth of _batched_updates; only the outermost batch flushes Tk
+_batch_depth = 0
+
+@contextmanager
+def _batched_updates(window):
+    """Groups a burst of element updates so Tk lays out and redraws once, on exit."""
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        _flush_updates(window)
+
+def _flush_updates(window):
+    """Runs Tk's pending layout/redraw pass now, unless an enclosing batch will do it."""
+    if _batch_depth == 0:
+        window.TKroot.update_idletasks()
+
+def _flush_status(window):
+    """Paints a just-set status message before a blocking operation, without dispatching queued events."""
+    _elements(window)[KEY_STATUS_BAR].Widget.update_idletasks()
+
+# Trailing delay for area-list rebuilds; stepping through rooms rebuilds the list once
+_AREA_REFRESH_DELAY_MS = 100
+_area_after_id: Optional[str] = None
+# Room whose areas the Area dropdown currently lists (None for no room)
+_area_list_room: Optional[str] = None
+
+def schedule_area_refresh(window, manager: ObjectDataManager, room_id: Optional[str]):
+    """Clears the area selection now and reloads the area list for room_id once room changes settle."""
+    global _area_after_id
+    room_id = room_id or None
+    if room_id == _area_list_room and _area_after_id is None:
+        return # Same room re-selected; its areas are already listed
+    root = window.TKroot
+    _cancel_area_refresh(window)
+    _set_field(_elements(window)[KEY_OBJECT_AREA_LOCATION], '') # Never leave the old room's area selected
+    _area_after_id = root.after(_AREA_REFRESH_DELAY_MS, _do_area_refresh, window, manager, room_id)
+
+def _cancel_area_refresh(window, listed_room: Optional[str] = None):
+    """Drops a pending area-list reload when the caller sets the list for listed_room directly."""
+    global _area_after_id, _area_list_room
+    if _area_after_id is not None:
+        window.TKroot.after_cancel(_area_after_id)
+        _area_after_id = None
+    _area_list_room = listed_room
+
+def _do_area_refresh(window, manager: ObjectDataManager, room_id: Optional[str]):
+    """Rebuilds the area dropdown for room_id. Runs from the Tk timer set by schedule_area_refresh."""
+    global _area_after_id, _area_list_room
+    _area_after_id = None
+    _area_list_room = room_id
+    area_ids = manager.get_area_ids_for_room(room_id) if room_id else []
+    _elements(window)[KEY_OBJECT_AREA_LOCATION].update(values=area_ids, value=None)
+
 def clear_fields(window):
     """Clears all input fields and resets controls to default for a NEW object."""
     logging.debug("Clearing all fields for new object.")
+    elem = _elements(window)
     # Basic Info
-    window[KEY_OBJECT_ID].update("", disabled=False) # Enable ID for new
-    window[KEY_OBJECT_NAME].update("")
-    window[KEY_OBJECT_IS_PLURAL].update(False)
-    window[KEY_OBJECT_CATEGORY].update("")
-    window[KEY_OBJECT_LOCATION].update("")
-    window[KEY_OBJECT_AREA_LOCATION].update(values=[], value=None) # Clear area selection
+    elem[KEY_OBJECT_ID].update("", disabled=False) # Enable ID for new
+    window.metadata['is_new_object'] = True
+    _set_field(elem[KEY_OBJECT_NAME], "")
+    _set_field(elem[KEY_OBJECT_IS_PLURAL], False)
+    _set_field(elem[KEY_OBJECT_CATEGORY], "")
+    _set_field(elem[KEY_OBJECT_LOCATION], "")
+    _cancel_area_refresh(window)
+    elem[KEY_OBJECT_AREA_LOCATION].update(values=[], value=None) # Clear area selection
 
     # Set Count field to indicate automatic assignment for new objects
-    window[KEY_OBJECT_COUNT].update("(Auto)") # Indicate automatic count
+    _set_field(elem[KEY_OBJECT_COUNT], "(Auto)") # Indicate automatic count
 
     # State & Lock
-    window[KEY_OBJECT_INITIAL_STATE].update(True)
-    window[KEY_OBJECT_IS_LOCKED].update(False)
-    window[KEY_OBJECT_POWER_STATE].update("")
-    window[KEY_OBJECT_LOCK_TYPE].update("")
-    window[KEY_OBJECT_LOCK_CODE].update("")
-    window[KEY_OBJECT_LOCK_KEY_ID].update("")
-
-    # Properties (Checkboxes reset to default, inputs cleared)
-    props = window.AllKeysDict # Get all keys
-    for key in props:
-        # --- Add check for string type ---
-        if isinstance(key, str):
-            if key.startswith("-PROP_") and isinstance(window[key], sg.Checkbox):
-                 # Reset checkboxes based on their default definition in layout (tricky, easier to list common ones)
-                 if key in [KEY_PROP_IS_INTERACTIVE]: # Default True properties
-                     window[key].update(True)
-                 else: # Most properties default False
-                     window[key].update(False)
-            elif key.startswith("-PROP_") and isinstance(window[key], sg.Input):
-                window[key].update("") # Clear property inputs like capacity, damage
+    _set_field(elem[KEY_OBJECT_INITIAL_STATE], True)
+    _set_field(elem[KEY_OBJECT_IS_LOCKED], False)
+    for _, key in _OPTIONAL_TEXT_FIELDS:
+        _set_field(elem[key], "")
+
+    # Properties (Checkboxes reset to their default, inputs like capacity/damage cleared)
+    for _, key, default, *_ in _BOOL_PROPS:
+        _set_field(elem[key], default)
+    for _, key, _ in _NUM_PROPS:
+        _set_field(elem[key], "")
 
     # Interaction (Inputs cleared)
-    window[KEY_INTERACTION_REQUIRED_STATE].update("")
-    window[KEY_INTERACTION_REQUIRED_ITEMS].update("")
-    window[KEY_INTERACTION_PRIMARY_ACTIONS].update("")
-    window[KEY_INTERACTION_EFFECTS].update("")
-    window[KEY_INTERACTION_SUCCESS].update("")
-    window[KEY_INTERACTION_FAILURE].update("")
+    _set_field(elem[KEY_INTERACTION_REQUIRED_STATE], "")
+    _set_field(elem[KEY_INTERACTION_REQUIRED_ITEMS], "")
+    _set_field(elem[KEY_INTERACTION_PRIMARY_ACTIONS], "")
+    _set_field(elem[KEY_INTERACTION_EFFECTS], "")
+    _set_field(elem[KEY_INTERACTION_SUCCESS], "")
+    _set_field(elem[KEY_INTERACTION_FAILURE], "")
 
     # Other
-    window[KEY_OBJECT_STORAGE_CONTENTS].update("")
-    window[KEY_OBJECT_STATE_DESCRIPTIONS].update("")
-    window[KEY_OBJECT_DIGITAL_CONTENT].update("")
+    _set_field(elem[KEY_OBJECT_STORAGE_CONTENTS], "")
+    _set_field(elem[KEY_OBJECT_STATE_DESCRIPTIONS], "")
+    _set_field(elem[KEY_OBJECT_DIGITAL_CONTENT], "")
 
     # Clear Wearability Frame (keep fields enabled)
-    window[KEY_WEAR_AREA].update(value='') # No disabled=True
-    window[KEY_WEAR_LAYER].update(value='') # No disabled=True
-
-    # Reset Wearable Checkbox
-    window[KEY_PROP_IS_WEARABLE].update(False)
+    _set_field(elem[KEY_WEAR_AREA], '') # No disabled=True
+    _set_field(elem[KEY_WEAR_LAYER], '') # No disabled=True
 
     # YAML Preview
-    window[KEY_YAML_PREVIEW].update("")
+    _clear_yaml_preview(window)
 
     # Set focus to ID field for new object
-    window[KEY_OBJECT_ID].set_focus(True)
+    elem[KEY_OBJECT_ID].set_focus(True)
     # Reset validation indicator
-    window[KEY_VALIDATE_INDICATOR].update("❓", text_color='grey')
-    window[KEY_STATUS_BAR].update("Enter details for new object.")
+    elem[KEY_VALIDATE_INDICATOR].update("❓", text_color='grey')
+    elem[KEY_STATUS_BAR].update("Enter details for new object.")
 
 def populate_fields(window, object_data: dict, manager: ObjectDataManager):
     """Populates GUI fields from the loaded object_data dictionary."""
@@ -270,166 +448,172 @@ def populate_fields(window, object_data: dict, manager: ObjectDataManager):
         return
 
     object_id = object_data.get('id')
-    logging.debug(f"Populating fields for object ID: {object_id}")
+    logging.debug("Populating fields for object ID: %s", object_id)
+    elem = _elements(window)
 
     # --- No need to call clear_fields here anymore, clearing happens on NEW ---
 
     # --- Get nested dictionaries safely ---
-    properties = object_data.get('properties', {}) or {} # Ensure dict
-    interaction = object_data.get('interaction', {}) or {} # Ensure dict
+    data_get = object_data.get # Bound once; read for every field below
+    properties = data_get('properties', {}) or {} # Ensure dict
+    interaction = data_get('interaction', {}) or {} # Ensure dict
+    interaction_get = interaction.get
 
     # --- Basic Info ---
-    window[KEY_OBJECT_ID].update(object_id)
-    window[KEY_OBJECT_ID].update(disabled=True) # Disable ID for existing object
-    window[KEY_OBJECT_NAME].update(object_data.get('name', ''))
-    window[KEY_OBJECT_IS_PLURAL].update(object_data.get('is_plural', False))
-    window[KEY_OBJECT_CATEGORY].update(object_data.get('category', ''))
+    elem[KEY_OBJECT_ID].update(value=object_id, disabled=True) # Disable ID for existing object
+    window.metadata['is_new_object'] = False
+    _set_field(elem[KEY_OBJECT_NAME], data_get('name', ''))
+    _set_field(elem[KEY_OBJECT_IS_PLURAL], data_get('is_plural', False))
+    _set_field(elem[KEY_OBJECT_CATEGORY], data_get('category', ''))
 
     # Populate Count field with the actual count from data for existing objects
-    window[KEY_OBJECT_COUNT].update(str(object_data.get('count', ''))) # Display existing count
+    _set_field(elem[KEY_OBJECT_COUNT], _num_str(object_data, 'count')) # Display existing count
 
     # Find and set location
     found_room_id, found_area_id = manager.find_object_location(object_id)
-    logging.debug(f"find_object_location returned: room='{found_room_id}', area='{found_area_id}'") # DEBUG LOG
-    window[KEY_OBJECT_LOCATION].update(value=found_room_id)
+    logging.debug("find_object_location returned: room='%s', area='%s'", found_room_id, found_area_id) # DEBUG LOG
+    _set_field(elem[KEY_OBJECT_LOCATION], found_room_id)
 
-    # Update area dropdown based on found room
+    # Update area dropdown based on found room (width/readonly are fixed in the layout)
     area_ids = []
     if found_room_id:
         area_ids = manager.get_area_ids_for_room(found_room_id)
-    # Workaround: Ensure list is not empty to prevent shrinking
-    display_area_ids = area_ids if area_ids else ['']
-    # Explicitly set readonly and size during update
-    window[KEY_OBJECT_AREA_LOCATION].update(values=display_area_ids, value=found_area_id, readonly=True, size=(30,1))
+    _cancel_area_refresh(window, found_room_id or None)
+    elem[KEY_OBJECT_AREA_LOCATION].update(values=area_ids, value=found_area_id)
 
-    window[KEY_OBJECT_WEIGHT].update(str(object_data.get('weight', 1.0)))
-    window[KEY_OBJECT_SIZE].update(str(object_data.get('size', 1.0)))
-    window[KEY_OBJECT_DESCRIPTION].update(object_data.get('description', ''))
-    window[KEY_OBJECT_SYNONYMS].update(_parse_list_to_csv(object_data.get('synonyms', [])))
+    _set_field(elem[KEY_OBJECT_WEIGHT], str(data_get('weight', 1.0)))
+    _set_field(elem[KEY_OBJECT_SIZE], str(data_get('size', 1.0)))
+    _set_field(elem[KEY_OBJECT_DESCRIPTION], data_get('description', ''))
+    _set_field(elem[KEY_OBJECT_SYNONYMS], _parse_list_to_csv(data_get('synonyms')))
 
     # --- State & Lock ---
-    window[KEY_OBJECT_INITIAL_STATE].update(object_data.get('initial_state', True)) # Note: Schema name vs Checkbox text
-    window[KEY_OBJECT_IS_LOCKED].update(object_data.get('is_locked', False))
-    window[KEY_OBJECT_POWER_STATE].update(object_data.get('power_state', '') or '') # Ensure empty string if None
-    window[KEY_OBJECT_LOCK_TYPE].update(object_data.get('lock_type', '') or '')
-    window[KEY_OBJECT_LOCK_CODE].update(object_data.get('lock_code', '') or '')
-    window[KEY_OBJECT_LOCK_KEY_ID].update(object_data.get('lock_key_id', '') or '')
+    _set_field(elem[KEY_OBJECT_INITIAL_STATE], data_get('initial_state', True)) # Note: Schema name vs Checkbox text
+    _set_field(elem[KEY_OBJECT_IS_LOCKED], data_get('is_locked', False))
+    for field, key in _OPTIONAL_TEXT_FIELDS:
+        _set_field(elem[key], data_get(field) or '') # Ensure empty string if None
 
     # --- Properties ---
+    prop_get = properties.get # Bound once for the table loops below
     # Booleans
-    window[KEY_PROP_IS_TAKEABLE].update(properties.get('is_takeable', False))
-    window[KEY_PROP_IS_INTERACTIVE].update(properties.get('is_interactive', True))
-    window[KEY_PROP_IS_DANGEROUS].update(properties.get('is_dangerous', False))
-    window[KEY_PROP_IS_DESTROYABLE].update(properties.get('is_destroyable', False))
-    window[KEY_PROP_IS_STORAGE].update(properties.get('is_storage', False))
-    window[KEY_PROP_IS_OPERATIONAL].update(properties.get('is_operational', False))
-    window[KEY_PROP_IS_EDIBLE].update(properties.get('is_edible', False))
-    window[KEY_PROP_IS_WEAPON].update(properties.get('is_weapon', False))
-    window[KEY_PROP_IS_MOVABLE].update(properties.get('is_movable', False))
-    window[KEY_PROP_IS_WEARABLE].update(properties.get('is_wearable', False))
-    window[KEY_PROP_IS_FLAMMABLE].update(properties.get('is_flammable', False))
-    window[KEY_PROP_IS_TOXIC].update(properties.get('is_toxic', False))
-    window[KEY_PROP_IS_FOOD].update(properties.get('is_food', False))
-    window[KEY_PROP_IS_COOKABLE].update(properties.get('is_cookable', False))
-    window[KEY_PROP_IS_CONSUMABLE].update(properties.get('is_consumable', False))
-    window[KEY_PROP_HAS_DURABILITY].update(properties.get('has_durability', False))
-    window[KEY_PROP_IS_HACKABLE].update(properties.get('is_hackable', False))
-    window[KEY_PROP_IS_HIDDEN].update(properties.get('is_hidden', False))
-    window[KEY_PROP_IS_RECHARGEABLE].update(properties.get('is_rechargeable', False))
-    window[KEY_PROP_IS_FUEL_SOURCE].update(properties.get('is_fuel_source', False))
-    window[KEY_PROP_REGENERATES].update(properties.get('regenerates', False))
-    window[KEY_PROP_IS_MODULAR].update(properties.get('is_modular', False))
-    window[KEY_PROP_IS_STORED].update(properties.get('is_stored', False))
-    window[KEY_PROP_IS_TRANSFERABLE].update(properties.get('is_transferable', False))
-    window[KEY_PROP_IS_ACTIVATABLE].update(properties.get('is_activatable', False))
-    window[KEY_PROP_IS_NETWORKED].update(properties.get('is_networked', False))
-    window[KEY_PROP_REQUIRES_POWER].update(properties.get('requires_power', False))
-    window[KEY_PROP_REQUIRES_ITEM].update(properties.get('requires_item', False))
-    window[KEY_PROP_HAS_SECURITY].update(properties.get('has_security', False))
-    window[KEY_PROP_IS_SENSITIVE].update(properties.get('is_sensitive', False))
-    window[KEY_PROP_IS_FRAGILE].update(properties.get('is_fragile', False))
-    window[KEY_PROP_IS_SECRET].update(properties.get('is_secret', False))
-    window[KEY_PROP_CAN_STORE_LIQUIDS].update(properties.get('can_store_liquids', False))
-    window[KEY_PROP_IS_SURFACE].update(properties.get('is_surface', False))
-    window[KEY_PROP_IS_CHARGER].update(properties.get('is_charger', False))
+    for field, key, default, *_ in _BOOL_PROPS:
+        _set_field(elem[key], prop_get(field, default))
     # Numeric/String Properties
-    window[KEY_PROP_STORAGE_CAPACITY].update(str(properties.get('storage_capacity', '')) if properties.get('storage_capacity') is not None else '')
-    window[KEY_PROP_DAMAGE].update(str(properties.get('damage', '')) if properties.get('damage') is not None else '')
-    window[KEY_PROP_DURABILITY].update(str(properties.get('durability', '')) if properties.get('durability') is not None else '')
-    window[KEY_PROP_RANGE].update(str(properties.get('range', '')) if properties.get('range') is not None else '')
+    for field, key, _ in _NUM_PROPS:
+        _set_field(elem[key], _num_str(properties, field))
 
     # Populate Wearability Frame (keep fields enabled)
-    wear_area_val = properties.get('wear_area', '')
-    wear_layer_val = properties.get('wear_layer', None)
-
-    window[KEY_WEAR_AREA].update(value=wear_area_val) # No disabled update
-    layer_str = str(wear_layer_val) if wear_layer_val is not None else ''
-    window[KEY_WEAR_LAYER].update(value=layer_str) # No disabled update
-
-    # Ensure the wearable checkbox itself is updated too
-    window[KEY_PROP_IS_WEARABLE].update(properties.get('is_wearable', False))
+    _set_field(elem[KEY_WEAR_AREA], prop_get('wear_area', '')) # No disabled update
+    _set_field(elem[KEY_WEAR_LAYER], _num_str(properties, 'wear_layer')) # No disabled update
 
     # --- Interaction ---
-    window[KEY_INTERACTION_REQUIRED_STATE].update(_parse_list_to_csv(interaction.get('required_state', [])))
-    window[KEY_INTERACTION_REQUIRED_ITEMS].update(_parse_list_to_csv(interaction.get('required_items', [])))
-    window[KEY_INTERACTION_PRIMARY_ACTIONS].update(_parse_list_to_csv(interaction.get('primary_actions', [])))
-    window[KEY_INTERACTION_EFFECTS].update(_parse_list_to_csv(interaction.get('effects', [])))
-    window[KEY_INTERACTION_SUCCESS].update(interaction.get('success_message', '') or '')
-    window[KEY_INTERACTION_FAILURE].update(interaction.get('failure_message', '') or '')
+    _set_field(elem[KEY_INTERACTION_REQUIRED_STATE], _parse_list_to_csv(interaction_get('required_state')))
+    _set_field(elem[KEY_INTERACTION_REQUIRED_ITEMS], _parse_list_to_csv(interaction_get('required_items')))
+    _set_field(elem[KEY_INTERACTION_PRIMARY_ACTIONS], _parse_list_to_csv(interaction_get('primary_actions')))
+    _set_field(elem[KEY_INTERACTION_EFFECTS], _parse_list_to_csv(interaction_get('effects')))
+    _set_field(elem[KEY_INTERACTION_SUCCESS], interaction_get('success_message', '') or '')
+    _set_field(elem[KEY_INTERACTION_FAILURE], interaction_get('failure_message', '') or '')
 
     # --- Other ---
-    window[KEY_OBJECT_STORAGE_CONTENTS].update(_parse_list_to_csv(object_data.get('storage_contents', [])))
-    window[KEY_OBJECT_STATE_DESCRIPTIONS].update(_parse_dict_to_multiline(object_data.get('state_descriptions', {})))
-    window[KEY_OBJECT_DIGITAL_CONTENT].update(_parse_digital_content_to_multiline(object_data.get('digital_content', {})))
+    _set_field(elem[KEY_OBJECT_STORAGE_CONTENTS], _parse_list_to_csv(data_get('storage_contents')))
+    _set_field(elem[KEY_OBJECT_STATE_DESCRIPTIONS], _parse_dict_to_multiline(data_get('state_descriptions', {})))
+    _set_field(elem[KEY_OBJECT_DIGITAL_CONTENT], _parse_digital_content_to_multiline(data_get('digital_content', {})))
 
     logging.debug("Finished populating fields.")
     # Update the YAML preview after populating, passing the manager
     update_yaml_preview(window, object_data, manager) # Pass manager here
+    # Single layout/redraw pass for all the field changes above
+    _flush_updates(window)
+
+# Trailing delay for preview refreshes; a burst of calls results in one dump
+_PREVIEW_DELAY_MS = 150
+_preview_after_id: Optional[str] = None
+# repr() of the data currently shown; a much cheaper equality check than re-dumping
+_last_preview_source: Optional[str] = None
 
 def update_yaml_preview(window, object_data: Optional[dict], manager: ObjectDataManager):
-    """Updates the YAML preview pane with the object's data."""
+    """Schedules a refresh of the YAML preview pane with the object's data.
+
+    Calls arriving within _PREVIEW_DELAY_MS of each other are debounced, so
+    only the last one serializes the object.
+    """
+    global _preview_after_id
+    root = window.TKroot
+    if _preview_after_id is not None:
+        root.after_cancel(_preview_after_id)
+    _preview_after_id = root.after(_PREVIEW_DELAY_MS, _do_yaml_preview, window, object_data)
+
+def _clear_yaml_preview(window):
+    """Empties the YAML preview pane, cancelling any pending refresh and forgetting what was shown."""
+    global _preview_after_id, _last_preview_source
+    if _preview_after_id is not None:
+        window.TKroot.after_cancel(_preview_after_id)
+        _preview_after_id = None
+    _last_preview_source = None
+    _set_field(_elements(window)[KEY_YAML_PREVIEW], "")
+
+def _do_yaml_preview(window, object_data: Optional[dict]):
+    """Renders object_data into the YAML preview pane, writing only if the text changed."""
+    global _preview_after_id, _last_preview_source
+    _preview_after_id = None
     if not object_data:
-        window[KEY_YAML_PREVIEW].update("")
+        _clear_yaml_preview(window)
+        return
+    preview = _elements(window)[KEY_YAML_PREVIEW]
+
+    source = repr(object_data)
+    if source == _last_preview_source:
+        logging.debug("YAML preview unchanged; skipping dump.")
         return
 
-    from io import StringIO
     string_stream = StringIO()
-    # Dump only the single object - might need refinement if order matters strictly
-    # or to show context, but good start.
     try:
-        manager.yaml.dump([object_data], string_stream) # Dump as a list containing the dict
-        preview_text = string_stream.getvalue()
-        # Remove the list indicator '-' at the start if present
-        if preview_text.startswith('- '):
-             preview_text = preview_text[2:]
-        window[KEY_YAML_PREVIEW].update(preview_text)
+        yaml.dump(object_data, string_stream, Dumper=_PreviewDumper, sort_keys=False, allow_unicode=True)
+        _set_field(preview, string_stream.getvalue())
+        _last_preview_source = source
         logging.debug("Updated YAML preview.")
     except Exception as e:
+        _last_preview_source = None
         logging.error(f"Error generating YAML preview: {e}")
-        window[KEY_YAML_PREVIEW].update(f"# Error generating preview:\n# {e}")
+        preview.update(f"# Error generating preview:\n# {e}")
+
+@lru_cache(maxsize=64)
+def _split_csv(csv_string: str) -> tuple[str, ...]:
+    """Splits a comma-separated string into stripped, non-empty items (memoized across Validate/Save)."""
+    return tuple(stripped for item in csv_string.split(',') if (stripped := item.strip()))
 
 def _parse_csv_to_list(csv_string: str) -> list:
-    """Converts a comma-separated string to a list of stripped strings."""
-    if not csv_string or not isinstance(csv_string, str):
-        return []
-    return [item.strip() for item in csv_string.split(',') if item.strip()]
+    """Converts a comma-separated Input string to a list of stripped strings."""
+    return list(_split_csv(csv_string)) if csv_string else []
 
 def _parse_multiline_to_dict(multiline_string: str) -> dict:
     """Converts key:value lines to a dictionary."""
     data_dict = {}
-    if not multiline_string or not isinstance(multiline_string, str):
+    if not multiline_string or not isinstance(multiline_string, str) or ':' not in multiline_string:
         return data_dict
+    strip = str.strip # Bound once for the loop
     for line in multiline_string.splitlines():
-        if ':' in line:
-            key, value = line.split(':', 1)
-            data_dict[key.strip()] = value.strip()
+        key, sep, value = line.partition(':')
+        if sep:
+            data_dict[strip(key)] = strip(value)
     return data_dict
 
-def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager) -> tuple[Optional[dict], Optional[str], Optional[str]]:
-    """Gathers data from GUI fields into a dictionary matching YAML structure, plus location."""
-    values = window.read(timeout=0)[1] # Get current values without blocking
+def _parse_whole_number(text: str, label: str) -> Optional[int]:
+    """Converts a field's text to an int, or None when blank. Raises ValueError naming the field."""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"{label} must be a whole number.")
+
+def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager, values: dict) -> tuple[Optional[dict], Optional[str], Optional[str]]:
+    """Gathers data from GUI fields into a dictionary matching YAML structure, plus location.
+
+    values is the dict returned by the event loop's window.read() for the
+    triggering click; the window is not read again here.
+    """
     gathered_data = {}
-    properties = {}
     interaction = {}
     error = None
 
@@ -440,7 +624,7 @@ def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager) -> tu
             raise ValueError("Object ID cannot be empty.")
         gathered_data['id'] = object_id
 
-        is_new_object = not window[KEY_OBJECT_ID].Disabled # Check if ID field is enabled
+        is_new_object = window.metadata['is_new_object'] # Tracks whether the ID field is enabled
 
         # Handle Count based on whether it's new or existing
         if is_new_object:
@@ -462,82 +646,20 @@ def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager) -> tu
         # --- State & Lock ---
         gathered_data['initial_state'] = values[KEY_OBJECT_INITIAL_STATE]
         gathered_data['is_locked'] = values[KEY_OBJECT_IS_LOCKED]
-        gathered_data['power_state'] = values[KEY_OBJECT_POWER_STATE] or None
-        gathered_data['lock_type'] = values[KEY_OBJECT_LOCK_TYPE] or None
-        gathered_data['lock_code'] = values[KEY_OBJECT_LOCK_CODE] or None
-        gathered_data['lock_key_id'] = values[KEY_OBJECT_LOCK_KEY_ID] or None
+        for field, key in _OPTIONAL_TEXT_FIELDS:
+            gathered_data[field] = values[key] or None
 
         # --- Properties ---
-        # (Gather boolean properties)
-        properties['is_takeable'] = values[KEY_PROP_IS_TAKEABLE]
-        properties['is_interactive'] = values[KEY_PROP_IS_INTERACTIVE]
-        properties['is_dangerous'] = values[KEY_PROP_IS_DANGEROUS]
-        properties['is_destroyable'] = values[KEY_PROP_IS_DESTROYABLE]
-        properties['is_storage'] = values[KEY_PROP_IS_STORAGE]
-        properties['is_operational'] = values[KEY_PROP_IS_OPERATIONAL]
-        properties['is_edible'] = values[KEY_PROP_IS_EDIBLE]
-        properties['is_weapon'] = values[KEY_PROP_IS_WEAPON]
-        properties['is_movable'] = values[KEY_PROP_IS_MOVABLE]
-        properties['is_wearable'] = values[KEY_PROP_IS_WEARABLE]
-        properties['is_flammable'] = values[KEY_PROP_IS_FLAMMABLE]
-        properties['is_toxic'] = values[KEY_PROP_IS_TOXIC]
-        properties['is_food'] = values[KEY_PROP_IS_FOOD]
-        properties['is_cookable'] = values[KEY_PROP_IS_COOKABLE]
-        properties['is_consumable'] = values[KEY_PROP_IS_CONSUMABLE]
-        properties['has_durability'] = values[KEY_PROP_HAS_DURABILITY]
-        properties['is_hackable'] = values[KEY_PROP_IS_HACKABLE]
-        properties['is_hidden'] = values[KEY_PROP_IS_HIDDEN]
-        properties['is_rechargeable'] = values[KEY_PROP_IS_RECHARGEABLE]
-        properties['is_fuel_source'] = values[KEY_PROP_IS_FUEL_SOURCE]
-        properties['regenerates'] = values[KEY_PROP_REGENERATES]
-        properties['is_modular'] = values[KEY_PROP_IS_MODULAR]
-        properties['is_stored'] = values[KEY_PROP_IS_STORED]
-        properties['is_transferable'] = values[KEY_PROP_IS_TRANSFERABLE]
-        properties['is_activatable'] = values[KEY_PROP_IS_ACTIVATABLE]
-        properties['is_networked'] = values[KEY_PROP_IS_NETWORKED]
-        properties['requires_power'] = values[KEY_PROP_REQUIRES_POWER]
-        properties['requires_item'] = values[KEY_PROP_REQUIRES_ITEM]
-        properties['has_security'] = values[KEY_PROP_HAS_SECURITY]
-        properties['is_sensitive'] = values[KEY_PROP_IS_SENSITIVE]
-        properties['is_fragile'] = values[KEY_PROP_IS_FRAGILE]
-        properties['is_secret'] = values[KEY_PROP_IS_SECRET]
-        properties['can_store_liquids'] = values[KEY_PROP_CAN_STORE_LIQUIDS]
-        properties['is_surface'] = values[KEY_PROP_IS_SURFACE]
-        properties['is_charger'] = values[KEY_PROP_IS_CHARGER]
-        
-        # (Gather numeric/string properties)
-        try:
-            capacity_str = values[KEY_PROP_STORAGE_CAPACITY].strip()
-            properties['storage_capacity'] = int(capacity_str) if capacity_str else None
-        except ValueError:
-            raise ValueError("Storage Capacity must be a whole number.")
-            
-        try:
-            damage_str = values[KEY_PROP_DAMAGE].strip()
-            properties['damage'] = int(damage_str) if damage_str else None
-        except ValueError:
-            raise ValueError("Damage must be a whole number.")
-            
-        try:
-            durability_str = values[KEY_PROP_DURABILITY].strip()
-            properties['durability'] = int(durability_str) if durability_str else None
-        except ValueError:
-            raise ValueError("Durability must be a whole number.")
-        
-        try:
-            range_str = values[KEY_PROP_RANGE].strip()
-            properties['range'] = int(range_str) if range_str else None # Assuming range is numeric for now
-        except ValueError:
-            raise ValueError("Range must be a whole number.")
+        # (Gather boolean and numeric properties in one build)
+        properties = {
+            **{field: values[key] for field, key, *_ in _BOOL_PROPS},
+            **{field: _parse_whole_number(values[key], label) for field, key, label in _NUM_PROPS},
+        }
 
         # (Gather wearability properties)
         if properties['is_wearable']:
             properties['wear_area'] = values[KEY_WEAR_AREA] or None
-            try:
-                layer_str = values[KEY_WEAR_LAYER].strip()
-                properties['wear_layer'] = int(layer_str) if layer_str else None
-            except ValueError:
-                raise ValueError("Wear Layer must be a whole number.")
+            properties['wear_layer'] = _parse_whole_number(values[KEY_WEAR_LAYER], "Wear Layer")
         else:
             properties.pop('wear_area', None) # Remove if not wearable
             properties.pop('wear_layer', None)
@@ -546,9 +668,9 @@ def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager) -> tu
              gathered_data['properties'] = properties
 
         # --- Interaction ---
-        interaction['required_state'] = _parse_csv_to_list(values[KEY_INTERACTION_REQUIRED_STATE])
-        interaction['failure_message'] = values[KEY_INTERACTION_FAILURE] or None
-        if any(interaction.values()): # Only add interaction key if there's data
+        interaction['required_state'] = required_state = _parse_csv_to_list(values[KEY_INTERACTION_REQUIRED_STATE])
+        interaction['failure_message'] = failure_message = values[KEY_INTERACTION_FAILURE] or None
+        if required_state or failure_message: # Only add interaction key if there's data
              gathered_data['interaction'] = interaction
 
         # --- Other --- (storage_contents, state_descriptions, digital_content)
@@ -578,6 +700,17 @@ def gather_data_from_fields(window: sg.Window, manager: ObjectDataManager) -> tu
     sg.popup_error(error, title="Data Input Error")
     return None, None, None # Indicate failure
 
+# Allowed ranges checked by validate_object_data
+_WEIGHT_MIN, _WEIGHT_MAX = 0.01, 250.0 # kg
+_SIZE_MIN, _SIZE_MAX = 1, 50
+_WEAR_LAYER_MIN, _WEAR_LAYER_MAX = 1, 10
+# (field, message) for fields that must be non-empty; the ID has its own uniqueness check
+_REQUIRED_FIELDS: tuple[tuple[str, str], ...] = (
+    ('name', "Name is required."),
+    ('category', "Category is required."),
+    ('description', "Description is required."),
+)
+
 def validate_object_data(object_data: dict, is_new: bool, manager: ObjectDataManager) -> list[str]:
     """Performs validation checks. Returns list of errors."""
     errors = []
@@ -587,34 +720,29 @@ def validate_object_data(object_data: dict, is_new: bool, manager: ObjectDataMan
     # Required fields
     if not object_data.get('id'):
         errors.append("Object ID is required.")
-    elif is_new and object_data['id'] in manager.get_object_ids():
+    elif is_new and object_data['id'] in manager.object_ids_set:
         errors.append(f"Object ID '{object_data['id']}' already exists.")
-    if not object_data.get('name'):
-        errors.append("Name is required.")
-    if not object_data.get('category'):
-        errors.append("Category is required.")
-    if not object_data.get('description'):
-        errors.append("Description is required.")
+    errors.extend(message for field, message in _REQUIRED_FIELDS if not object_data.get(field))
 
     # --- Add Weight and Size Range Checks ---
     weight = object_data.get('weight')
     size = object_data.get('size') # Should be float/int after gather_data
 
-    # Weight Check
+    # Weight Check (gather_data_from_fields already produced a float; only convert other input)
     if weight is not None:
         try:
-            w = float(weight) # Ensure it's treated as number
-            if not (0.01 <= w <= 250.0):
-                 errors.append(f"Weight ({w}) must be between 0.01 and 250.0 kg.")
+            w = weight if isinstance(weight, (int, float)) else float(weight)
+            if not (_WEIGHT_MIN <= w <= _WEIGHT_MAX):
+                 errors.append(f"Weight ({w}) must be between {_WEIGHT_MIN} and {_WEIGHT_MAX} kg.")
         except (ValueError, TypeError):
              errors.append(f"Weight must be a valid number (e.g., 1.0, 0.5). Got: '{weight}'")
 
     # Size Check
     if size is not None:
         try:
-            s = float(size) # Allow float input, check range based on int logic
-            if not (1 <= s <= 50):
-                 errors.append(f"Size ({s}) must be between 1 and 50.")
+            s = size if isinstance(size, (int, float)) else float(size) # Allow float input, check range based on int logic
+            if not (_SIZE_MIN <= s <= _SIZE_MAX):
+                 errors.append(f"Size ({s}) must be between {_SIZE_MIN} and {_SIZE_MAX}.")
             # Optional: Check if it's reasonably an integer if needed?
             # if s != int(s): errors.append("Size should ideally be a whole number.")
         except (ValueError, TypeError):
@@ -633,9 +761,9 @@ def validate_object_data(object_data: dict, is_new: bool, manager: ObjectDataMan
             errors.append("Wearable items must have a 'Wear Area' selected.")
         if wear_layer_prop is not None:
              try:
-                 layer = int(wear_layer_prop)
-                 if not (1 <= layer <= 10):
-                      errors.append("Wear Layer must be between 1 and 10.")
+                 layer = wear_layer_prop if isinstance(wear_layer_prop, int) else int(wear_layer_prop)
+                 if not (_WEAR_LAYER_MIN <= layer <= _WEAR_LAYER_MAX):
+                      errors.append(f"Wear Layer must be between {_WEAR_LAYER_MIN} and {_WEAR_LAYER_MAX}.")
              except (ValueError, TypeError):
                   errors.append("Wear Layer must be a whole number.")
 
@@ -653,14 +781,16 @@ def main():
     sg.theme("DarkBlue3")
     try:
         manager = ObjectDataManager(data_dir=Path("data"))
-        object_ids = manager.get_object_ids()
-        room_ids = manager.get_room_ids()
+        object_ids = tuple(manager.get_object_ids())
+        room_ids = tuple(manager.get_room_ids())
         initial_total_objects = manager.get_object_count() # Get initial count
     except Exception as e:
         logging.error(f"Failed to initialize ObjectDataManager: {e}")
         sg.popup_error(f"Failed to load data files.\nError: {e}", title="Initialization Error")
         return
 
+    categories = get_object_categories() # Cached tuple, shared with the Combo
+
     # --- Define Layout Sections ---
     # Top controls - ADDED PUSH and TOTAL COUNT DISPLAY
     top_controls = [
@@ -677,9 +807,9 @@ def main():
         [sg.Text("Object ID:", size=(12,1)), sg.Input(key=KEY_OBJECT_ID, size=(30,1), readonly=True)],
         [sg.Text("Name:", size=(12,1)), sg.Input(key=KEY_OBJECT_NAME, size=(40,1))],
         [sg.Text("Is Plural?", size=(12,1)), sg.Checkbox('', key=KEY_OBJECT_IS_PLURAL, default=False)],
-        [sg.Text("Category:", size=(12,1)), sg.Combo(get_object_categories(), key=KEY_OBJECT_CATEGORY, readonly=True, size=(20,1))],
+        [sg.Text("Category:", size=(12,1)), sg.Combo(categories, key=KEY_OBJECT_CATEGORY, readonly=True, size=(20,1))],
         [sg.Text("Room Location:", size=(12,1)), sg.Combo(room_ids, key=KEY_OBJECT_LOCATION, readonly=True, size=(30,1), enable_events=True)],
-        [sg.Text("Area Location:", size=(12,1)), sg.Combo([], key=KEY_OBJECT_AREA_LOCATION, readonly=True, size=(30,1))],
+        [sg.Text("Area Location:", size=(12,1)), sg.Combo([], key=KEY_OBJECT_AREA_LOCATION, readonly=True, size=(30,1), auto_size_text=False)], # Fixed width: updating values won't resize it
         [sg.Text("Count:", size=(12,1)), sg.Input(key=KEY_OBJECT_COUNT, size=(10,1), readonly=True)], # READONLY, no default
         [sg.Text("Weight:", size=(12,1)), sg.Input(key=KEY_OBJECT_WEIGHT, size=(10,1), default_text="1.0")],
         [sg.Text("Size:", size=(12,1)), sg.Input(key=KEY_OBJECT_SIZE, size=(10,1), default_text="1.0")],
@@ -692,55 +822,19 @@ def main():
     state_lock_frame = sg.Frame("State and Locking", [
          [sg.Checkbox("Visible Initially", key=KEY_OBJECT_INITIAL_STATE, default=True)],
          [sg.Checkbox("Is Locked", key=KEY_OBJECT_IS_LOCKED, default=False)],
-         [sg.Text("Power State:", size=(10,1)), sg.Combo(['', 'offline', 'emergency', 'main_power', 'torch_light'], key=KEY_OBJECT_POWER_STATE, size=(20,1), default_value='')],
-         [sg.Text("Lock Type:", size=(10,1)), sg.Combo(['', 'key', 'code', 'biometric'], key=KEY_OBJECT_LOCK_TYPE, size=(20,1), default_value='')],
+         [sg.Text("Power State:", size=(10,1)), sg.Combo(_POWER_STATE_CHOICES, key=KEY_OBJECT_POWER_STATE, size=(20,1), default_value='')],
+         [sg.Text("Lock Type:", size=(10,1)), sg.Combo(_LOCK_TYPE_CHOICES, key=KEY_OBJECT_LOCK_TYPE, size=(20,1), default_value='')],
          [sg.Text("Lock Code:", size=(10,1)), sg.Input(key=KEY_OBJECT_LOCK_CODE, size=(20,1))],
          [sg.Text("Lock Key ID:", size=(10,1)), sg.Input(key=KEY_OBJECT_LOCK_KEY_ID, size=(30,1))],
     ])
 
     # --- Properties Frame (Expanded) ---
     # Arrange properties into columns for better spacing
-    prop_col1 = [
-        [sg.Checkbox("Takeable", key=KEY_PROP_IS_TAKEABLE, default=False)],
-        [sg.Checkbox("Interactive", key=KEY_PROP_IS_INTERACTIVE, default=True)],
-        [sg.Checkbox("Dangerous", key=KEY_PROP_IS_DANGEROUS, default=False)],
-        [sg.Checkbox("Destroyable", key=KEY_PROP_IS_DESTROYABLE, default=False)],
-        [sg.Checkbox("Is Storage", key=KEY_PROP_IS_STORAGE, default=False)],
-        [sg.Checkbox("Operational", key=KEY_PROP_IS_OPERATIONAL, default=False)],
-        [sg.Checkbox("Edible", key=KEY_PROP_IS_EDIBLE, default=False)],
-        [sg.Checkbox("Is Weapon", key=KEY_PROP_IS_WEAPON, default=False)],
-        [sg.Checkbox("Movable", key=KEY_PROP_IS_MOVABLE, default=False)],
-        [sg.Checkbox("Wearable", key=KEY_PROP_IS_WEARABLE, default=False)],
-    ]
-    prop_col2 = [
-        [sg.Checkbox("Flammable", key=KEY_PROP_IS_FLAMMABLE, default=False)],
-        [sg.Checkbox("Toxic", key=KEY_PROP_IS_TOXIC, default=False)],
-        [sg.Checkbox("Is Food", key=KEY_PROP_IS_FOOD, default=False)],
-        [sg.Checkbox("Cookable", key=KEY_PROP_IS_COOKABLE, default=False)],
-        [sg.Checkbox("Consumable", key=KEY_PROP_IS_CONSUMABLE, default=False)],
-        [sg.Checkbox("Has Durability", key=KEY_PROP_HAS_DURABILITY, default=False)],
-        [sg.Checkbox("Hackable", key=KEY_PROP_IS_HACKABLE, default=False)],
-        [sg.Checkbox("Hidden", key=KEY_PROP_IS_HIDDEN, default=False)],
-        [sg.Checkbox("Rechargeable", key=KEY_PROP_IS_RECHARGEABLE, default=False)],
-        [sg.Checkbox("Fuel Source", key=KEY_PROP_IS_FUEL_SOURCE, default=False)],
-    ]
-    prop_col3 = [
-        [sg.Checkbox("Regenerates", key=KEY_PROP_REGENERATES, default=False)],
-        [sg.Checkbox("Modular", key=KEY_PROP_IS_MODULAR, default=False)],
-        [sg.Checkbox("Is Stored", key=KEY_PROP_IS_STORED, default=False)], # Digital context
-        [sg.Checkbox("Transferable", key=KEY_PROP_IS_TRANSFERABLE, default=False)], # Digital context
-        [sg.Checkbox("Activatable", key=KEY_PROP_IS_ACTIVATABLE, default=False)],
-        [sg.Checkbox("Networked", key=KEY_PROP_IS_NETWORKED, default=False)],
-        [sg.Checkbox("Requires Power", key=KEY_PROP_REQUIRES_POWER, default=False)],
-        [sg.Checkbox("Requires Item", key=KEY_PROP_REQUIRES_ITEM, default=False)],
-        [sg.Checkbox("Has Security", key=KEY_PROP_HAS_SECURITY, default=False)],
-        [sg.Checkbox("Sensitive", key=KEY_PROP_IS_SENSITIVE, default=False)],
-    ]
-    prop_col4 = [
-        [sg.Checkbox("Is Surface", key=KEY_PROP_IS_SURFACE, default=False)],
-        [sg.Checkbox("Is Charger", key=KEY_PROP_IS_CHARGER, default=False)],
-        [sg.Checkbox("Fragile", key=KEY_PROP_IS_FRAGILE, default=False)],
-        [sg.Checkbox("Secret", key=KEY_PROP_IS_SECRET, default=False)],
+    prop_cols = [[], [], [], []]
+    for _, key, default, label, column in _BOOL_PROPS:
+        if column is not None:
+            prop_cols[column].append([sg.Checkbox(label, key=key, default=default)])
+    prop_cols[3] += [
         [sg.Text("_"*15)], # Visual separator
         [sg.Text("Storage Specific:", font=("Any", 10, "bold"))],
         [sg.Text("Capacity:", size=(8,1)), sg.Input(key=KEY_PROP_STORAGE_CAPACITY, size=(10,1))],
@@ -753,10 +847,10 @@ def main():
     ]
 
     properties_frame = sg.Frame("Properties", [
-        [sg.Column(prop_col1), sg.VSeparator(),
-         sg.Column(prop_col2), sg.VSeparator(),
-         sg.Column(prop_col3), sg.VSeparator(),
-         sg.Column(prop_col4)]
+        [sg.Column(prop_cols[0]), sg.VSeparator(),
+         sg.Column(prop_cols[1]), sg.VSeparator(),
+         sg.Column(prop_cols[2]), sg.VSeparator(),
+         sg.Column(prop_cols[3])]
     ])
 
     # --- Interaction Frame (Expanded) ---
@@ -786,11 +880,9 @@ def main():
     ])
 
     # --- Wearability Frame definition ---
-    wear_area_values = [''] + [area.value for area in WearArea]
-    wear_layer_values = [''] + ['1', '2', '3', '4', '5'] # Add blank option
     wearability_frame = sg.Frame("Wearability", [
-        [sg.Text("Area:", size=(6,1)), sg.Combo(wear_area_values, key=KEY_WEAR_AREA, size=(15, 1), readonly=True, tooltip="Body area where item is worn (blank for none)")], # Updated tooltip
-        [sg.Text("Layer:", size=(6,1)), sg.Combo(wear_layer_values, key=KEY_WEAR_LAYER, size=(5, 1), readonly=True, tooltip="Layer order (blank for none)")] # Updated tooltip
+        [sg.Text("Area:", size=(6,1)), sg.Combo(_WEAR_AREA_CHOICES, key=KEY_WEAR_AREA, size=(15, 1), readonly=True, tooltip="Body area where item is worn (blank for none)")], # Updated tooltip
+        [sg.Text("Layer:", size=(6,1)), sg.Combo(_WEAR_LAYER_CHOICES, key=KEY_WEAR_LAYER, size=(5, 1), readonly=True, tooltip="Layer order (blank for none)")] # Updated tooltip
     ], vertical_alignment='top')
 
     # --- RE-ADD Bottom Controls Definition ---
@@ -831,11 +923,15 @@ def main():
     ]
 
     # --- Create Window ---
-    window = sg.Window("Starship Adventure 2 - Object Editor", layout, resizable=True, finalize=True)
+    # metadata['is_new_object'] mirrors the ID field's enabled state (set by clear/populate_fields)
+    window = sg.Window("Starship Adventure 2 - Object Editor", layout, resizable=True, finalize=True,
+                       metadata={'is_new_object': True})
+    elem = _elements(window) # Resolve element references once, now the window is finalized
 
     # --- Event Loop ---
     current_object_id = None # Track which object is loaded
     current_object_data = None # Store the full data of the loaded object
+    known_ids = list(object_ids) # Sorted dropdown IDs, kept in step with saves and deletes
 
     while True:
         event, values = window.read()
@@ -844,75 +940,68 @@ def main():
         if event == sg.WIN_CLOSED or event == KEY_CLOSE_BUTTON:
             break
 
-        window[KEY_STATUS_BAR].update("")
+        elem[KEY_STATUS_BAR].update("")
 
         if event == KEY_OBJECT_DROPDOWN or event == KEY_LOAD_BUTTON:
             selected_id = values[KEY_OBJECT_DROPDOWN]
             if selected_id:
                 logging.info(f"Load requested for: {selected_id}")
-                window[KEY_STATUS_BAR].update(f"Loading data for {selected_id}...")
-                window.refresh() # Show status update immediately
+                elem[KEY_STATUS_BAR].update(f"Loading data for {selected_id}...")
+                _flush_status(window) # Show status update immediately
 
                 loaded_data = manager.get_object_by_id(selected_id)
                 if loaded_data:
                     current_object_id = selected_id
                     current_object_data = loaded_data # Store loaded data
-                    populate_fields(window, current_object_data, manager)
-                    update_yaml_preview(window, current_object_data, manager)
-                    window[KEY_STATUS_BAR].update(f"Loaded: {selected_id}")
+                    with _batched_updates(window):
+                        populate_fields(window, current_object_data, manager)
+                        update_yaml_preview(window, current_object_data, manager)
+                        elem[KEY_STATUS_BAR].update(f"Loaded: {selected_id}")
                 else:
                     logging.error(f"Failed to retrieve data for selected ID: {selected_id}")
                     sg.popup_error(f"Could not load data for object '{selected_id}'. Check data files.", title="Load Error")
                     current_object_id = None
                     current_object_data = None
                     clear_fields(window) # Clear fields on error
-                    window[KEY_STATUS_BAR].update(f"Error loading {selected_id}.")
+                    elem[KEY_STATUS_BAR].update(f"Error loading {selected_id}.")
 
             else:
-                 window[KEY_STATUS_BAR].update("Select an object ID to load.")
+                 elem[KEY_STATUS_BAR].update("Select an object ID to load.")
 
         elif event == KEY_OBJECT_LOCATION: # Room selection changed
             selected_room_id = values[KEY_OBJECT_LOCATION]
             logging.info(f"Room selection changed to: {selected_room_id}")
-            area_ids = []
-            if selected_room_id:
-                area_ids = manager.get_area_ids_for_room(selected_room_id)
-            # Workaround: Ensure list is not empty
-            display_area_ids = area_ids if area_ids else ['']
-            # Explicitly set readonly and size during update
-            window[KEY_OBJECT_AREA_LOCATION].update(values=display_area_ids, value=None, readonly=True, size=(30,1))
+            schedule_area_refresh(window, manager, selected_room_id)
 
         elif event == KEY_NEW_BUTTON:
             logging.info("New Object button clicked.")
-            window[KEY_STATUS_BAR].update("Enter details for new object. ID cannot be changed after saving.")
+            elem[KEY_STATUS_BAR].update("Enter details for new object. ID cannot be changed after saving.")
             current_object_id = None
             current_object_data = None
-            clear_fields(window) # Use the helper function
-            update_yaml_preview(window, None, manager) # Clear preview
-            window[KEY_OBJECT_AREA_LOCATION].update(values=[], value=None) # Clear area dropdown
+            clear_fields(window) # Use the helper function (also clears the area dropdown and preview)
 
         elif event == KEY_VALIDATE_BUTTON:
             logging.info("Validate button clicked.")
             # --- VALIDATION LOGIC ONLY --- 
-            gathered_data, _, _ = gather_data_from_fields(window, manager) # Ignore location here
+            gathered_data, _, _ = gather_data_from_fields(window, manager, values) # Ignore location here
 
             if gathered_data is None:
-                window[KEY_VALIDATE_INDICATOR].update('❌', text_color='red')
-                window[KEY_STATUS_BAR].update("Validation Error: Failed to gather data from fields. Check logs.")
+                elem[KEY_VALIDATE_INDICATOR].update('❌', text_color='red')
+                elem[KEY_STATUS_BAR].update("Validation Error: Failed to gather data from fields. Check logs.")
                 update_yaml_preview(window, None, manager) 
                 continue 
 
-            is_new_object = not window[KEY_OBJECT_ID].Disabled
+            is_new_object = window.metadata['is_new_object']
             validation_errors = validate_object_data(gathered_data, is_new_object, manager)
 
             if not validation_errors:
-                window[KEY_VALIDATE_INDICATOR].update('✔️', text_color='green')
-                window[KEY_STATUS_BAR].update("Validation successful.")
+                elem[KEY_VALIDATE_INDICATOR].update('✔️', text_color='green')
+                elem[KEY_STATUS_BAR].update("Validation successful.")
                 update_yaml_preview(window, gathered_data, manager) 
             else:
-                window[KEY_VALIDATE_INDICATOR].update('❌', text_color='red')
+                elem[KEY_VALIDATE_INDICATOR].update('❌', text_color='red')
                 error_message = "Validation Failed: " + "; ".join(validation_errors)
-                window[KEY_STATUS_BAR].update(error_message)
+                elem[KEY_STATUS_BAR].update(error_message)
                 logging.warning(error_message)
                 update_yaml_preview(window, gathered_data, manager)
             # --- END OF VALIDATION LOGIC ---
@@ -920,27 +1009,27 @@ def main():
         elif event == KEY_SAVE_BUTTON:
             # --- MOVED SAVE LOGIC HERE --- 
             logging.info("Save Changes button clicked.")
-            window[KEY_STATUS_BAR].update("Saving...")
-            window.refresh()
+            elem[KEY_STATUS_BAR].update("Saving...")
+            _flush_status(window)
 
-            gathered_data, selected_room_id, selected_area_id = gather_data_from_fields(window, manager)
+            gathered_data, selected_room_id, selected_area_id = gather_data_from_fields(window, manager, values)
             
             if gathered_data is None:
                 sg.popup_error("Cannot save: Error gathering data from form. Check logs.", title="Save Error")
-                window[KEY_STATUS_BAR].update("Save failed: Invalid data.")
+                elem[KEY_STATUS_BAR].update("Save failed: Invalid data.")
                 continue
 
             # No longer needed: explicit room check
             # if not selected_room_id: ... continue
 
-            is_new_object = not window[KEY_OBJECT_ID].Disabled
+            is_new_object = window.metadata['is_new_object']
             validation_errors = validate_object_data(gathered_data, is_new_object, manager)
 
             if validation_errors:
                 error_str = "\n".join(validation_errors)
                 confirm = sg.popup_yes_no(f"Validation Issues Found:\n{error_str}\n\nSave anyway?", title="Validation Warning")
                 if confirm == 'No':
-                    window[KEY_STATUS_BAR].update("Save cancelled due to validation issues.")
+                    elem[KEY_STATUS_BAR].update("Save cancelled due to validation issues.")
                     continue 
                 # END of the validation error check block
 
@@ -952,12 +1041,12 @@ def main():
                 items_skipped = []
 
                 for item_id in original_contents:
-                    logging.debug(f"[Check 1]   Processing item_id: '{item_id}'") 
+                    logging.debug("[Check 1]   Processing item_id: '%s'", item_id) 
                     item_data = manager.get_object_by_id(item_id) 
-                    logging.debug(f"[Check 1]     Found item_data: {item_data is not None}") 
+                    logging.debug("[Check 1]     Found item_data: %s", item_data is not None) 
                     if item_data:
                         is_initial = item_data.get('initial_state', True) 
-                        logging.debug(f"[Check 1]       initial_state value: {is_initial} (Type: {type(is_initial)})") 
+                        logging.debug("[Check 1]       initial_state value: %s (Type: %s)", is_initial, type(is_initial)) 
                         if not is_initial:
                             logging.debug("[Check 1]         Condition 'not is_initial' is TRUE. Showing popup.") 
                             item_name = item_data.get('name', item_id)
@@ -981,7 +1070,7 @@ def main():
 
                 if items_skipped:
                     skipped_str = ", ".join(items_skipped)
-                    window[KEY_STATUS_BAR].update(f"Note: Skipped adding items to contents: {skipped_str}")
+                    elem[KEY_STATUS_BAR].update(f"Note: Skipped adding items to contents: {skipped_str}")
                     sg.popup_notify(f"Skipped adding to contents (initial_state=False):\n{skipped_str}", title="Contents Note")
             # --- END OF CHECK 1 ---
 
@@ -998,7 +1087,7 @@ def main():
                 )
                 if confirm_loc_add == 'No':
                     add_object_to_room_location = False
-                    window[KEY_STATUS_BAR].update(f"Note: '{object_name_for_warn}' will NOT be added to '{room_name_for_warn}'s starting objects.")
+                    elem[KEY_STATUS_BAR].update(f"Note: '{object_name_for_warn}' will NOT be added to '{room_name_for_warn}'s starting objects.")
             # --- END CHECK 2 ---
             
             # --- Optional: Warning for saving without location --- 
@@ -1008,7 +1097,7 @@ def main():
                      title="Confirm Save Without Location"
                  )
                 if confirm_no_loc == 'No':
-                     window[KEY_STATUS_BAR].update("Save cancelled: No location selected.")
+                     elem[KEY_STATUS_BAR].update("Save cancelled: No location selected.")
                      continue # Stop the save process
             # --- End Optional Warning ---
 
@@ -1036,57 +1125,63 @@ def main():
                     
                     # Handle outcome
                     if save_successful:
-                        window[KEY_STATUS_BAR].update(f"Object '{object_id_to_save}' saved successfully!")
-                        # Refresh UI
-                        new_object_ids = manager.get_object_ids()
-                        new_total_count = manager.get_object_count() 
-                        window[KEY_OBJECT_DROPDOWN].update(values=new_object_ids)
-                        window[KEY_TOTAL_OBJECT_COUNT].update(f"Total Objects: {new_total_count}") 
-                        window[KEY_OBJECT_DROPDOWN].update(value=object_id_to_save) 
-                        current_object_data = manager.get_object_by_id(object_id_to_save)
-                        if current_object_data:
-                             populate_fields(window, current_object_data, manager)
-                             update_yaml_preview(window, current_object_data, manager)
-                        else: 
-                              clear_fields(window)
-                              update_yaml_preview(window, None, manager)
+                        # The saved object is now the loaded one (a new object's ID is fixed from here on)
+                        current_object_id = object_id_to_save
+                        # Refresh UI in one layout/redraw pass
+                        with _batched_updates(window):
+                            elem[KEY_STATUS_BAR].update(f"Object '{object_id_to_save}' saved successfully!")
+                            # Editing keeps the ID list as-is; only a new object needs adding to the dropdown
+                            if is_new_object:
+                                insort(known_ids, object_id_to_save)
+                                elem[KEY_OBJECT_DROPDOWN].update(values=known_ids)
+                            new_total_count = manager.get_object_count()
+                            elem[KEY_TOTAL_OBJECT_COUNT].update(f"Total Objects: {new_total_count}")
+                            elem[KEY_OBJECT_DROPDOWN].update(value=object_id_to_save)
+                            current_object_data = manager.get_object_by_id(object_id_to_save)
+                            if current_object_data:
+                                 populate_fields(window, current_object_data, manager)
+                                 update_yaml_preview(window, current_object_data, manager)
+                            else:
+                                  clear_fields(window)
+                                  update_yaml_preview(window, None, manager)
                     else:
-                         window[KEY_STATUS_BAR].update("Save failed! Check logs.") 
+                         elem[KEY_STATUS_BAR].update("Save failed! Check logs.") 
 
                 except Exception as e:
                     logging.exception(f"Error during save operation for {gathered_data.get('id')}") # Log full traceback
                     sg.popup_error(f"Failed to save changes.\nError: {e}", title="Save Error")
-                    window[KEY_STATUS_BAR].update(f"Save failed: {e}")
+                    elem[KEY_STATUS_BAR].update(f"Save failed: {e}")
             else:
-                window[KEY_STATUS_BAR].update("Save cancelled.")
+                elem[KEY_STATUS_BAR].update("Save cancelled.")
             # --- END OF MOVED SAVE LOGIC --- 
 
         elif event == KEY_DELETE_BUTTON:
             selected_id_to_delete = values[KEY_OBJECT_DROPDOWN]
             logging.info(f"Delete button clicked for: {selected_id_to_delete}")
             if not selected_id_to_delete:
-                 window[KEY_STATUS_BAR].update("Select an object from the dropdown to delete.")
+                 elem[KEY_STATUS_BAR].update("Select an object from the dropdown to delete.")
                  continue
 
             if sg.popup_yes_no(f"Are you sure you want to permanently delete object '{selected_id_to_delete}'?", title="Confirm Delete", button_color=('white','red')) == 'Yes':
-                 window[KEY_STATUS_BAR].update(f"Deleting {selected_id_to_delete}...")
-                 window.refresh()
+                 elem[KEY_STATUS_BAR].update(f"Deleting {selected_id_to_delete}...")
+                 _flush_status(window)
                  if manager.delete_object(selected_id_to_delete):
-                     window[KEY_STATUS_BAR].update(f"Object '{selected_id_to_delete}' deleted successfully.")
+                     elem[KEY_STATUS_BAR].update(f"Object '{selected_id_to_delete}' deleted successfully.")
                      current_object_id = None
                      current_object_data = None
                      clear_fields(window)
                      update_yaml_preview(window, None, manager)
                      # Refresh dropdown AND total count
-                     new_object_ids = manager.get_object_ids()
+                     if selected_id_to_delete in known_ids:
+                         known_ids.remove(selected_id_to_delete)
                      new_total_count = manager.get_object_count()
-                     window[KEY_OBJECT_DROPDOWN].update(values=new_object_ids, value='')
-                     window[KEY_TOTAL_OBJECT_COUNT].update(f"Total Objects: {new_total_count}") # Update display
+                     elem[KEY_OBJECT_DROPDOWN].update(values=known_ids, value='')
+                     elem[KEY_TOTAL_OBJECT_COUNT].update(f"Total Objects: {new_total_count}") # Update display
                  else:
-                     window[KEY_STATUS_BAR].update(f"Delete failed for '{selected_id_to_delete}'. Check logs.")
+                     elem[KEY_STATUS_BAR].update(f"Delete failed for '{selected_id_to_delete}'. Check logs.")
                      sg.popup_error(f"Failed to delete object '{selected_id_to_delete}'. Check logs for details.", title="Delete Error")
             else:
-                 window[KEY_STATUS_BAR].update("Delete cancelled.")
+                 elem[KEY_STATUS_BAR].update("Delete cancelled.")
 
     window.close()
 
@@ -27,6 +27,12 @@ class ObjectDataManager:
 
         self.objects_data: Optional[List[Dict[str, Any]]] = None
         self.rooms_data: Optional[Dict[str, Any]] = None # Rooms are usually dicts {id: data}
+        self._object_ids: set[str] = set() # Kept in step with objects_data for O(1) membership checks
+        # Memoized room scans; cleared whenever room placements change
+        self._location_cache: Dict[str, tuple[Optional[str], Optional[str]]] = {}
+        self._area_ids_cache: Dict[str, List[str]] = {}
+        # Memoized get_object_by_id hits; cleared whenever objects_data changes
+        self._object_cache: Dict[str, Dict[str, Any]] = {}
 
         self._load_data()
 
@@ -41,6 +47,9 @@ class ObjectDataManager:
         # Let's convert the list from yaml into a dict for internal use, matching game_state
         rooms_list = raw_rooms.get('rooms', []) if isinstance(raw_rooms, dict) else raw_rooms if isinstance(raw_rooms, list) else []
         self.rooms_data = {room.get('room_id'): room for room in rooms_list if isinstance(room, dict) and 'room_id' in room}
+        self._object_ids = {obj['id'] for obj in self.objects_data if isinstance(obj, dict) and obj.get('id')}
+        self._object_cache.clear()
+        self._invalidate_location_caches()
 
         if not self.objects_data:
             logging.warning(f"No objects found or loaded from {self.objects_file}. Check format (expected list under 'objects:' key).")
@@ -71,6 +80,11 @@ class ObjectDataManager:
         """Returns the current number of loaded objects."""
         return len(self.objects_data)
 
+    @property
+    def object_ids_set(self) -> set[str]:
+        """The set of loaded object IDs, for fast membership checks. Do not modify."""
+        return self._object_ids
+
     def get_object_ids(self) -> List[str]:
         """Returns a sorted list of all object IDs from the loaded list."""
         if not self.objects_data or not isinstance(self.objects_data, list):
@@ -116,6 +130,9 @@ class ObjectDataManager:
               return None
 
          search_id = object_id.strip() # Strip whitespace from the ID we are searching for
+         cached = self._object_cache.get(search_id)
+         if cached is not None:
+             return cached
 
          for i, obj in enumerate(self.objects_data):
              if isinstance(obj, dict):
@@ -123,7 +140,8 @@ class ObjectDataManager:
                  if isinstance(obj_id_val, str):
                      # --- Compare stripped versions ---
                      if obj_id_val.strip() == search_id:
-                         logging.debug(f"get_object_by_id: Match found for '{search_id}' at index {i}.")
+                         logging.debug("get_object_by_id: Match found for '%s' at index %s.", search_id, i)
+                         self._object_cache[search_id] = obj
                          return obj
                  else:
                      logging.warning(f"get_object_by_id: Object at index {i} has non-string ID: {obj_id_val}")
@@ -133,10 +151,18 @@ class ObjectDataManager:
          logging.warning(f"get_object_by_id: No match found for '{search_id}'.")
          return None
 
+    def _invalidate_location_caches(self):
+        """Forgets memoized object locations and area lists after rooms_data changes."""
+        self._location_cache.clear()
+        self._area_ids_cache.clear()
+
     def get_area_ids_for_room(self, room_id: str) -> List[str]:
         """Returns a sorted list of area IDs for a given room ID."""
         if not self.rooms_data or room_id not in self.rooms_data:
             return []
+        cached = self._area_ids_cache.get(room_id)
+        if cached is not None:
+            return list(cached)
         room_data = self.rooms_data.get(room_id, {})
         areas_list = room_data.get("areas", [])
         if not isinstance(areas_list, list):
@@ -148,7 +174,8 @@ class ObjectDataManager:
             for area in areas_list
             if isinstance(area, dict) and "area_id" in area
         ]
-        return sorted([aid for aid in area_ids if aid])
+        self._area_ids_cache[room_id] = sorted([aid for aid in area_ids if aid])
+        return list(self._area_ids_cache[room_id])
 
     def find_object_location(self, object_id: str) -> tuple[Optional[str], Optional[str]]:
         """
@@ -159,14 +186,19 @@ class ObjectDataManager:
             but not within a specific area, or if areas aren't defined properly.
             Both are None if the object is not found in any room's/area's objects_present list.
         """
-        logging.debug(f"find_object_location: Entered for object_id='{object_id}'. Checking self.rooms_data (len={len(self.rooms_data) if self.rooms_data else 0}). Is dict? {isinstance(self.rooms_data, dict)}")
+        logging.debug("find_object_location: Entered for object_id='%s'. Checking self.rooms_data (len=%s). Is dict? %s", object_id, len(self.rooms_data) if self.rooms_data else 0, isinstance(self.rooms_data, dict))
 
         if not self.rooms_data or not object_id:
             logging.debug("find_object_location: Exiting early because self.rooms_data is empty or object_id is missing.") # Log the early exit
             return None, None
 
         search_id = object_id.strip()
+        if search_id not in self._location_cache:
+            self._location_cache[search_id] = self._scan_object_location(search_id)
+        return self._location_cache[search_id]
 
+    def _scan_object_location(self, search_id: str) -> tuple[Optional[str], Optional[str]]:
+        """Walks every room's and area's objects_present list looking for search_id."""
         for room_id, room_data in self.rooms_data.items():
             if not isinstance(room_data, dict): continue
 
@@ -174,18 +206,18 @@ class ObjectDataManager:
             room_objects = room_data.get("objects_present", [])
             if isinstance(room_objects, list):
                 # --- Log the raw list content ---
-                logging.debug(f"Room '{room_id}' room_objects: {room_objects}")
+                logging.debug("Room '%s' room_objects: %s", room_id, room_objects)
                 for obj_dict in room_objects:
                     if isinstance(obj_dict, dict):
                          obj_id_val = obj_dict.get('id', '')
                          # --- Log extracted ID and comparison ---
-                         logging.debug(f"  Checking room obj: ID='{obj_id_val}' (Type: {type(obj_id_val)}), Comparing '{obj_id_val.strip() if isinstance(obj_id_val, str) else obj_id_val}' == '{search_id}'")
+                         logging.debug("  Checking room obj: ID='%s' (Type: %s), Comparing '%s' == '%s'", obj_id_val, type(obj_id_val), obj_id_val.strip() if isinstance(obj_id_val, str) else obj_id_val, search_id)
                          if isinstance(obj_id_val, str) and obj_id_val.strip() == search_id:
-                            logging.debug(f"Object '{search_id}' found directly in room '{room_id}'.")
+                            logging.debug("Object '%s' found directly in room '%s'.", search_id, room_id)
                             return room_id, None
                     else:
                         # Log items that are not dictionaries
-                        logging.debug(f"  Skipping non-dict room obj: {obj_dict} (Type: {type(obj_dict)}) ")
+                        logging.debug("  Skipping non-dict room obj: %s (Type: %s) ", obj_dict, type(obj_dict))
 
 
             # Check area-level objects_present
@@ -197,20 +229,20 @@ class ObjectDataManager:
                     area_objects = area_data.get("objects_present", [])
                     if isinstance(area_objects, list):
                          # --- Log the raw list content ---
-                         logging.debug(f"Area '{area_id}' in room '{room_id}' area_objects: {area_objects}")
+                         logging.debug("Area '%s' in room '%s' area_objects: %s", area_id, room_id, area_objects)
                          for obj_dict in area_objects:
                              if isinstance(obj_dict, dict):
                                  obj_id_val = obj_dict.get('id', '')
                                  # --- Log extracted ID and comparison ---
-                                 logging.debug(f"    Checking area obj: ID='{obj_id_val}' (Type: {type(obj_id_val)}), Comparing '{obj_id_val.strip() if isinstance(obj_id_val, str) else obj_id_val}' == '{search_id}'")
+                                 logging.debug("    Checking area obj: ID='%s' (Type: %s), Comparing '%s' == '%s'", obj_id_val, type(obj_id_val), obj_id_val.strip() if isinstance(obj_id_val, str) else obj_id_val, search_id)
                                  if isinstance(obj_id_val, str) and obj_id_val.strip() == search_id:
-                                     logging.debug(f"Object '{search_id}' found in area '{area_id}' of room '{room_id}'.")
+                                     logging.debug("Object '%s' found in area '%s' of room '%s'.", search_id, area_id, room_id)
                                      return room_id, area_id
                              else:
                                  # Log items that are not dictionaries
-                                 logging.debug(f"    Skipping non-dict area obj: {obj_dict} (Type: {type(obj_dict)}) ")
+                                 logging.debug("    Skipping non-dict area obj: %s (Type: %s) ", obj_dict, type(obj_dict))
 
-        logging.debug(f"Object '{search_id}' not found in any room or area 'objects_present' list.")
+        logging.debug("Object '%s' not found in any room or area 'objects_present' list.", search_id)
         return None, None
 
     # --- Methods for modifying and saving data will go here ---
@@ -239,6 +271,7 @@ class ObjectDataManager:
              return False
 
         self.objects_data.append(new_object_data)
+        self._object_ids.add(new_object_data['id'])
         logging.info(f"Added new object '{new_object_data['id']}' to internal list.")
         return True
 
@@ -257,6 +290,7 @@ class ObjectDataManager:
                 self.objects_data[i] = updated_object_data
                 # Ensure the ID in the new data matches (should already, but good practice)
                 self.objects_data[i]['id'] = object_id.strip()
+                self._object_cache.clear()
                 logging.info(f"Updated object '{object_id}' in internal list.")
                 return True
 
@@ -269,6 +303,7 @@ class ObjectDataManager:
         if not object_id: return False
 
         object_id_to_save = {'id': object_id} # Store as dict in rooms.yaml
+        self._invalidate_location_caches()
 
         # 1. Find and remove from old location(s)
         for room_id, room_data in self.rooms_data.items():
@@ -338,6 +373,8 @@ class ObjectDataManager:
 
         # Remove from objects list
         deleted_obj_data = self.objects_data.pop(original_object_index)
+        self._object_ids.discard(deleted_obj_data.get('id'))
+        self._object_cache.clear()
         logging.info(f"Removed object '{object_id}' from internal objects list.")
 
         # Remove from room/area location